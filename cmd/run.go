@@ -12,6 +12,9 @@ import (
 	"github.com/giantswarm/llm-testing/internal/testsuite"
 )
 
+// progressInterval is the minimum time between progress line updates.
+const progressInterval = 100 * time.Millisecond
+
 func newRunCmd() *cobra.Command {
 	var (
 		model       string
@@ -21,6 +24,9 @@ func newRunCmd() *cobra.Command {
 		outputDir   string
 		suitesDir   string
 		timeout     time.Duration
+		concurrency int
+		rpm         int
+		resume      string
 	)
 
 	cmd := &cobra.Command{
@@ -30,7 +36,9 @@ func newRunCmd() *cobra.Command {
 The model to test must be specified via --model. Models are NOT part of the test
 suite configuration -- test suites only define the questions and evaluation strategy.
 
-Results are written to the output directory as text files with a JSON metadata manifest.`,
+Results are written to the output directory as text files with a JSON metadata manifest.
+Answers are checkpointed as they arrive; pass --resume with the run ID of an
+interrupted run to continue it without asking answered questions again.`,
 		Args: cobra.ExactArgs(1),
 		RunE: func(cmd *cobra.Command, args []string) error {
 			if model == "" {
@@ -62,8 +70,19 @@ Results are written to the output directory as text files with a JSON metadata m
 			}
 
 			r := runner.NewRunner(client, strategy, outputDir)
+			r.SetConcurrency(concurrency)
+			r.SetRequestsPerMinute(rpm)
+			r.SetResumeRunID(resume)
+			// Redraw the progress line at most every progressInterval; with many
+			// fast concurrent answers, one terminal write per question adds up.
+			// Progress calls are serialized, so lastProgress needs no lock.
+			var lastProgress time.Time
 			r.SetProgressFunc(func(modelName string, idx, total int) {
-				fmt.Printf("\r  [%s] Processing question %d/%d...", modelName, idx, total)
+				if idx < total && time.Since(lastProgress) < progressInterval {
+					return
+				}
+				lastProgress = time.Now()
+				fmt.Printf("\r  [%s] Completed question %d/%d...", modelName, idx, total)
 			})
 
 			fmt.Printf("Test Suite: %s\n", suite.Name)
@@ -95,6 +114,9 @@ Results are written to the output directory as text files with a JSON metadata m
 	cmd.Flags().Float64Var(&temperature, "temperature", 0.0, "Temperature for generation")
 	cmd.Flags().StringVar(&outputDir, "output-dir", "results", "Directory for test results")
 	cmd.Flags().StringVar(&suitesDir, "suites-dir", "", "External test suites directory")
+	cmd.Flags().IntVar(&concurrency, "concurrency", runner.DefaultConcurrency, "Maximum number of questions sent to the model in parallel")
+	cmd.Flags().IntVar(&rpm, "requests-per-minute", 0, "Maximum number of questions sent per minute. 0 means no limit")
+	cmd.Flags().StringVar(&resume, "resume", "", "Run ID of an interrupted run to continue")
 	cmd.Flags().DurationVar(&timeout, "timeout", 0, "Overall timeout for the test run (e.g. 30m, 1h). 0 means no timeout")
 
 	return cmd
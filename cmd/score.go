@@ -15,6 +15,10 @@ func newScoreCmd() *cobra.Command {
 		scoringEndpoint string
 		scoringAPIKey   string
 		repetitions     int
+		stream          bool
+		batch           bool
+		maxChunkChars   int
+		concurrency     int
 	)
 
 	cmd := &cobra.Command{
@@ -34,8 +38,12 @@ JSON scores.`,
 			client := newLLMClientFromFlags(scoringEndpoint, scoringAPIKey)
 
 			s := scorer.NewScorer(client, scorer.Config{
-				Model:       scoringModel,
-				Repetitions: repetitions,
+				Model:         scoringModel,
+				Repetitions:   repetitions,
+				Stream:        stream,
+				Batch:         batch,
+				MaxChunkChars: maxChunkChars,
+				Concurrency:   concurrency,
 			})
 
 			fmt.Printf("Scoring: %s\n", resultsFile)
@@ -84,6 +92,10 @@ JSON scores.`,
 	cmd.Flags().StringVar(&scoringEndpoint, "scoring-endpoint", "", "Scoring LLM endpoint URL")
 	cmd.Flags().StringVar(&scoringAPIKey, "api-key", "", "Scoring API key (or set OPENAI_API_KEY)")
 	cmd.Flags().IntVar(&repetitions, "repetitions", 3, "Number of scoring repetitions")
+	cmd.Flags().IntVar(&concurrency, "concurrency", scorer.DefaultConcurrency, "Maximum number of scoring requests sent in parallel")
+	cmd.Flags().BoolVar(&batch, "batch", false, "Submit all repetitions as one OpenAI Batch API job (cheaper, but may take hours)")
+	cmd.Flags().IntVar(&maxChunkChars, "max-chunk-chars", scorer.DefaultMaxChunkChars, "Score results larger than this many characters in chunks of whole questions")
+	cmd.Flags().BoolVar(&stream, "stream", false, "Use streaming completions for scoring (for endpoints that time out long non-streaming requests)")
 
 	return cmd
 }
@@ -153,4 +153,5 @@ func TestDefaultModelConfig(t *testing.T) {
 	assert.Equal(t, "hf://org/model", cfg.ModelURI)
 	assert.Equal(t, "kserve-vllm", cfg.Runtime)
 	assert.Equal(t, 1, cfg.GPUCount)
+	assert.Equal(t, []string{"--enable-prefix-caching"}, cfg.RuntimeArgs)
 }
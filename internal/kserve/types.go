@@ -32,6 +32,11 @@ type ModelStatus struct {
 	Message     string `json:"message,omitempty"`
 }
 
+// DefaultRuntimeArgs are passed to the vLLM runtime for every deployed model.
+// Prefix caching lets vLLM reuse the KV cache of the system prompt, which is
+// identical for every question in a test suite, instead of re-running prefill.
+var DefaultRuntimeArgs = []string{"--enable-prefix-caching"}
+
 // DefaultModelConfig returns sensible defaults for a model config.
 func DefaultModelConfig(name, modelURI string) ModelConfig {
 	return ModelConfig{
@@ -39,6 +44,7 @@ func DefaultModelConfig(name, modelURI string) ModelConfig {
 		ModelURI:     modelURI,
 		Runtime:      "kserve-vllm",
 		GPUCount:     1,
+		RuntimeArgs:  append([]string(nil), DefaultRuntimeArgs...),
 		ReadyTimeout: 10 * time.Minute,
 	}
 }
@@ -0,0 +1,200 @@
+package llm
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"log/slog"
+	"net/http"
+	"strconv"
+	"strings"
+	"time"
+
+	"github.com/sashabaranov/go-openai"
+)
+
+// BatchClient is implemented by clients that can submit many chat requests as
+// a single asynchronous batch job. Batch jobs trade latency (they may take
+// hours to complete) for lower per-request cost and provider overhead.
+type BatchClient interface {
+	// ChatCompletionBatch submits all requests as one batch and blocks until
+	// it finishes. Results are returned in request order.
+	ChatCompletionBatch(ctx context.Context, reqs []ChatRequest) ([]BatchResult, error)
+}
+
+// BatchResult is the outcome of a single request within a batch.
+type BatchResult struct {
+	Response *ChatResponse
+	Err      error
+}
+
+const batchCustomIDPrefix = "request-"
+
+// batchCancelTimeout bounds the cancel request sent for an abandoned batch.
+const batchCancelTimeout = 30 * time.Second
+
+// ChatCompletionBatch submits reqs to the OpenAI Batch API and polls until the
+// batch reaches a terminal state. Polling and result downloads are retried on
+// transient failures. Once the results are read, the batch's input, output and
+// error files are deleted. If ctx is done before the batch completes, the
+// batch is cancelled at the provider so it does not keep running.
+func (c *OpenAIClient) ChatCompletionBatch(ctx context.Context, reqs []ChatRequest) ([]BatchResult, error) {
+	upload := openai.UploadBatchFileRequest{FileName: "llm-testing-batch.jsonl"}
+	for i, req := range reqs {
+		upload.AddChatCompletion(batchCustomIDPrefix+strconv.Itoa(i), toOpenAIRequest(req))
+	}
+
+	batch, err := c.client.CreateBatchWithUploadFile(ctx, openai.CreateBatchWithUploadFileRequest{
+		Endpoint:               openai.BatchEndpointChatCompletions,
+		CompletionWindow:       "24h",
+		UploadBatchFileRequest: upload,
+	})
+	if err != nil {
+		return nil, fmt.Errorf("failed to create batch: %w", err)
+	}
+	batchID := batch.ID
+
+	ticker := time.NewTicker(c.batchPollInterval)
+	defer ticker.Stop()
+
+	for batch.Status != "completed" {
+		switch batch.Status {
+		case "failed", "expired", "cancelled":
+			return nil, fmt.Errorf("batch %s ended with status %q", batchID, batch.Status)
+		}
+
+		select {
+		case <-ctx.Done():
+			c.cancelBatch(ctx, batchID)
+			return nil, ctx.Err()
+		case <-ticker.C:
+		}
+
+		err = c.withRetry(ctx, func() error {
+			var err error
+			batch, err = c.client.RetrieveBatch(ctx, batchID)
+			return err
+		})
+		if err != nil {
+			if ctx.Err() != nil {
+				c.cancelBatch(ctx, batchID)
+			}
+			return nil, fmt.Errorf("failed to retrieve batch %s: %w", batchID, err)
+		}
+	}
+
+	results := make([]BatchResult, len(reqs))
+	for i := range results {
+		results[i].Err = fmt.Errorf("no result for request %d in batch %s", i, batchID)
+	}
+
+	// Successful requests land in the output file, failed ones in the error file.
+	for _, fileID := range []*string{batch.OutputFileID, batch.ErrorFileID} {
+		if fileID == nil || *fileID == "" {
+			continue
+		}
+		if err := c.readBatchFile(ctx, *fileID, results); err != nil {
+			return nil, fmt.Errorf("failed to read results of batch %s: %w", batchID, err)
+		}
+	}
+
+	c.deleteBatchFiles(ctx, batchID, &batch.InputFileID, batch.OutputFileID, batch.ErrorFileID)
+
+	return results, nil
+}
+
+// deleteBatchFiles removes the files of a finished batch from the provider's
+// storage, where they would otherwise accumulate across runs. Deletion is best
+// effort: failures are logged and do not affect the batch results.
+func (c *OpenAIClient) deleteBatchFiles(ctx context.Context, batchID string, fileIDs ...*string) {
+	for _, fileID := range fileIDs {
+		if fileID == nil || *fileID == "" {
+			continue
+		}
+		if err := c.client.DeleteFile(ctx, *fileID); err != nil {
+			slog.Warn("failed to delete batch file", "batch_id", batchID, "file_id", *fileID, "error", err)
+		}
+	}
+}
+
+// cancelBatch asks the provider to cancel a batch that is no longer awaited.
+// ctx is already done at this point, so the request uses a detached context.
+// On failure the batch ID is logged so the batch can be cancelled or fetched
+// by hand.
+func (c *OpenAIClient) cancelBatch(ctx context.Context, batchID string) {
+	cancelCtx, cancel := context.WithTimeout(context.WithoutCancel(ctx), batchCancelTimeout)
+	defer cancel()
+
+	if _, err := c.client.CancelBatch(cancelCtx, batchID); err != nil {
+		slog.Warn("failed to cancel abandoned batch, it may still be running", "batch_id", batchID, "error", err)
+		return
+	}
+	slog.Warn("cancelled abandoned batch", "batch_id", batchID)
+}
+
+// readBatchFile downloads a batch result file into results. The download is
+// retried as a whole if it fails part-way; lines already parsed are simply
+// overwritten on the next attempt.
+func (c *OpenAIClient) readBatchFile(ctx context.Context, fileID string, results []BatchResult) error {
+	return c.withRetry(ctx, func() error {
+		content, err := c.client.GetFileContent(ctx, fileID)
+		if err != nil {
+			return err
+		}
+		defer func() { _ = content.Close() }()
+
+		return parseBatchOutput(content, results)
+	})
+}
+
+// batchOutputLine is one line of a Batch API output or error file.
+type batchOutputLine struct {
+	CustomID string `json:"custom_id"`
+	Response *struct {
+		StatusCode int                           `json:"status_code"`
+		Body       openai.ChatCompletionResponse `json:"body"`
+	} `json:"response"`
+	Error *struct {
+		Code    string `json:"code"`
+		Message string `json:"message"`
+	} `json:"error"`
+}
+
+// parseBatchOutput decodes a JSONL batch result file into results, matching
+// lines to requests by custom ID. Lines with unknown IDs are ignored.
+func parseBatchOutput(r io.Reader, results []BatchResult) error {
+	dec := json.NewDecoder(r)
+	for {
+		var line batchOutputLine
+		if err := dec.Decode(&line); err != nil {
+			if errors.Is(err, io.EOF) {
+				return nil
+			}
+			return fmt.Errorf("invalid batch output line: %w", err)
+		}
+
+		idxStr, ok := strings.CutPrefix(line.CustomID, batchCustomIDPrefix)
+		if !ok {
+			continue
+		}
+		i, err := strconv.Atoi(idxStr)
+		if err != nil || i < 0 || i >= len(results) {
+			continue
+		}
+
+		switch {
+		case line.Error != nil:
+			results[i] = BatchResult{Err: fmt.Errorf("batch request failed: %s: %s", line.Error.Code, line.Error.Message)}
+		case line.Response == nil:
+			results[i] = BatchResult{Err: fmt.Errorf("batch request returned no response")}
+		case line.Response.StatusCode != http.StatusOK:
+			results[i] = BatchResult{Err: fmt.Errorf("batch request failed with status %d", line.Response.StatusCode)}
+		case len(line.Response.Body.Choices) == 0:
+			results[i] = BatchResult{Err: fmt.Errorf("no choices returned")}
+		default:
+			results[i] = BatchResult{Response: &ChatResponse{Content: line.Response.Body.Choices[0].Message.Content}}
+		}
+	}
+}
@@ -0,0 +1,166 @@
+package llm
+
+import (
+	"context"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestParseBatchOutput(t *testing.T) {
+	output := `{"id":"r1","custom_id":"request-1","response":{"status_code":200,"body":{"choices":[{"index":0,"message":{"role":"assistant","content":"7 out of 10"}}]}},"error":null}
+{"id":"r0","custom_id":"request-0","response":{"status_code":200,"body":{"choices":[{"index":0,"message":{"role":"assistant","content":"8 out of 10"}}]}},"error":null}
+{"id":"r2","custom_id":"request-2","response":{"status_code":500,"body":{}},"error":null}
+{"id":"r3","custom_id":"request-3","response":null,"error":{"code":"rate_limit","message":"too many requests"}}
+{"id":"rx","custom_id":"unrelated","response":null,"error":null}
+`
+	results := make([]BatchResult, 5)
+	require.NoError(t, parseBatchOutput(strings.NewReader(output), results))
+
+	// Lines are matched by custom ID, not by position in the file.
+	require.NotNil(t, results[0].Response)
+	assert.Equal(t, "8 out of 10", results[0].Response.Content)
+	require.NotNil(t, results[1].Response)
+	assert.Equal(t, "7 out of 10", results[1].Response.Content)
+
+	assert.Error(t, results[2].Err)
+	assert.Contains(t, results[2].Err.Error(), "status 500")
+	assert.Error(t, results[3].Err)
+	assert.Contains(t, results[3].Err.Error(), "too many requests")
+
+	// Requests absent from the file are left untouched.
+	assert.Nil(t, results[4].Response)
+	assert.Nil(t, results[4].Err)
+}
+
+func TestParseBatchOutputInvalidJSON(t *testing.T) {
+	results := make([]BatchResult, 1)
+	err := parseBatchOutput(strings.NewReader("not json\n"), results)
+	assert.Error(t, err)
+}
+
+// fakeBatchServer serves the Batch API endpoints used by ChatCompletionBatch.
+// Each poll of the batch returns the next status in statuses; the last one is
+// repeated once they run out.
+type fakeBatchServer struct {
+	t        *testing.T
+	statuses []string
+	output   string
+	errors   string
+	onPoll   func()
+
+	mu        sync.Mutex
+	polls     int
+	cancelled bool
+	deleted   []string
+}
+
+func (s *fakeBatchServer) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	switch {
+	case r.Method == http.MethodPost && r.URL.Path == "/v1/files":
+		fmt.Fprint(w, `{"id":"file-in","object":"file","purpose":"batch"}`)
+	case r.Method == http.MethodPost && r.URL.Path == "/v1/batches":
+		fmt.Fprint(w, s.batchJSON("validating"))
+	case r.Method == http.MethodGet && r.URL.Path == "/v1/batches/batch-1":
+		status := s.statuses[min(s.polls, len(s.statuses)-1)]
+		s.polls++
+		fmt.Fprint(w, s.batchJSON(status))
+		if s.onPoll != nil {
+			s.onPoll()
+		}
+	case r.Method == http.MethodPost && r.URL.Path == "/v1/batches/batch-1/cancel":
+		s.cancelled = true
+		fmt.Fprint(w, s.batchJSON("cancelling"))
+	case r.Method == http.MethodGet && r.URL.Path == "/v1/files/file-out/content":
+		fmt.Fprint(w, s.output)
+	case r.Method == http.MethodGet && r.URL.Path == "/v1/files/file-err/content":
+		fmt.Fprint(w, s.errors)
+	case r.Method == http.MethodDelete && strings.HasPrefix(r.URL.Path, "/v1/files/"):
+		fileID := strings.TrimPrefix(r.URL.Path, "/v1/files/")
+		s.deleted = append(s.deleted, fileID)
+		fmt.Fprintf(w, `{"id":%q,"object":"file","deleted":true}`, fileID)
+	default:
+		s.t.Errorf("unexpected request: %s %s", r.Method, r.URL.Path)
+		http.NotFound(w, r)
+	}
+}
+
+func (s *fakeBatchServer) batchJSON(status string) string {
+	files := ""
+	if status == "completed" {
+		files = `,"output_file_id":"file-out","error_file_id":"file-err"`
+	}
+	return fmt.Sprintf(`{"id":"batch-1","object":"batch","endpoint":"/v1/chat/completions","input_file_id":"file-in","completion_window":"24h","status":%q%s}`, status, files)
+}
+
+func TestChatCompletionBatch(t *testing.T) {
+	fake := &fakeBatchServer{
+		t:        t,
+		statuses: []string{"in_progress", "completed"},
+		output:   `{"id":"r0","custom_id":"request-0","response":{"status_code":200,"body":{"choices":[{"index":0,"message":{"role":"assistant","content":"8 out of 10"}}]}},"error":null}` + "\n",
+		errors:   `{"id":"r1","custom_id":"request-1","response":null,"error":{"code":"server_error","message":"boom"}}` + "\n",
+	}
+	srv := httptest.NewServer(fake)
+	defer srv.Close()
+
+	client := NewOpenAIClient(
+		WithBaseURL(srv.URL+"/v1"),
+		WithAPIKey("test"),
+		WithBatchPollInterval(time.Millisecond),
+	)
+
+	results, err := client.ChatCompletionBatch(context.Background(), []ChatRequest{
+		{Model: "m", UserMessage: "q0"},
+		{Model: "m", UserMessage: "q1"},
+	})
+	require.NoError(t, err)
+	require.Len(t, results, 2)
+
+	require.NoError(t, results[0].Err)
+	assert.Equal(t, "8 out of 10", results[0].Response.Content)
+	require.Error(t, results[1].Err)
+	assert.Contains(t, results[1].Err.Error(), "boom")
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	assert.Equal(t, 2, fake.polls)
+	assert.False(t, fake.cancelled)
+	assert.ElementsMatch(t, []string{"file-in", "file-out", "file-err"}, fake.deleted)
+}
+
+func TestChatCompletionBatchCancelsOnContextDone(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	fake := &fakeBatchServer{
+		t:        t,
+		statuses: []string{"in_progress"},
+		onPoll:   cancel,
+	}
+	srv := httptest.NewServer(fake)
+	defer srv.Close()
+
+	client := NewOpenAIClient(
+		WithBaseURL(srv.URL+"/v1"),
+		WithAPIKey("test"),
+		WithBatchPollInterval(time.Millisecond),
+	)
+
+	_, err := client.ChatCompletionBatch(ctx, []ChatRequest{{Model: "m", UserMessage: "q0"}})
+	require.ErrorIs(t, err, context.Canceled)
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	assert.True(t, fake.cancelled)
+	assert.Empty(t, fake.deleted)
+}
@@ -5,7 +5,9 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"net/http"
 	"strings"
+	"time"
 
 	"github.com/sashabaranov/go-openai"
 )
@@ -53,16 +55,40 @@ func (s *StreamReader) Close() {
 	_ = s.stream.Close()
 }
 
-// OpenAIClient implements Client using the OpenAI-compatible API.
+// sharedHTTPClient is the HTTP client used by every OpenAIClient unless
+// overridden with WithHTTPClient. Sharing one transport lets connections to an
+// endpoint be reused across clients (one is created per model), concurrent
+// questions and scoring repetitions. http.DefaultTransport keeps only two idle
+// connections per host, which makes most concurrent requests dial anew.
+var sharedHTTPClient = &http.Client{Transport: newPooledTransport()}
+
+func newPooledTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 256
+	t.MaxIdleConnsPerHost = 64
+	return t
+}
+
+// defaultBatchPollInterval is how often batch job status is checked.
+const defaultBatchPollInterval = 30 * time.Second
+
+// OpenAIClient implements Client and BatchClient using the OpenAI-compatible API.
 type OpenAIClient struct {
-	client *openai.Client
+	client            *openai.Client
+	batchPollInterval time.Duration
+	maxRetries        int
+	retryBaseDelay    time.Duration
+	retryMaxDelay     time.Duration
 }
 
 // NewOpenAIClient creates a new OpenAI-compatible client.
 func NewOpenAIClient(opts ...Option) *OpenAIClient {
 	cfg := &clientConfig{
-		baseURL: "http://localhost:8000/v1",
-		apiKey:  "not-needed",
+		baseURL:           "http://localhost:8000/v1",
+		apiKey:            "not-needed",
+		httpClient:        sharedHTTPClient,
+		batchPollInterval: defaultBatchPollInterval,
+		maxRetries:        defaultMaxRetries,
 	}
 	for _, opt := range opts {
 		opt(cfg)
@@ -70,24 +96,25 @@ func NewOpenAIClient(opts ...Option) *OpenAIClient {
 
 	config := openai.DefaultConfig(cfg.apiKey)
 	config.BaseURL = cfg.baseURL
+	config.HTTPClient = cfg.httpClient
 
 	return &OpenAIClient{
-		client: openai.NewClientWithConfig(config),
+		client:            openai.NewClientWithConfig(config),
+		batchPollInterval: cfg.batchPollInterval,
+		maxRetries:        cfg.maxRetries,
+		retryBaseDelay:    defaultRetryBaseDelay,
+		retryMaxDelay:     defaultRetryMaxDelay,
 	}
 }
 
 // ChatCompletion sends a non-streaming chat completion request.
+// Transient failures are retried with backoff (see WithMaxRetries).
 func (c *OpenAIClient) ChatCompletion(ctx context.Context, req ChatRequest) (*ChatResponse, error) {
-	messages := []openai.ChatCompletionMessage{
-		{Role: openai.ChatMessageRoleSystem, Content: req.SystemMessage},
-		{Role: openai.ChatMessageRoleUser, Content: req.UserMessage},
-	}
-
-	temp := float32(temperatureValue(req.Temperature))
-	resp, err := c.client.CreateChatCompletion(ctx, openai.ChatCompletionRequest{
-		Model:       req.Model,
-		Messages:    messages,
-		Temperature: temp,
+	var resp openai.ChatCompletionResponse
+	err := c.withRetry(ctx, func() error {
+		var err error
+		resp, err = c.client.CreateChatCompletion(ctx, toOpenAIRequest(req))
+		return err
 	})
 	if err != nil {
 		return nil, fmt.Errorf("chat completion failed: %w", err)
@@ -103,17 +130,14 @@ func (c *OpenAIClient) ChatCompletion(ctx context.Context, req ChatRequest) (*Ch
 }
 
 // ChatCompletionStream sends a streaming chat completion request.
+// Opening the stream is retried on transient failures; errors while reading
+// an established stream are not.
 func (c *OpenAIClient) ChatCompletionStream(ctx context.Context, req ChatRequest) (*StreamReader, error) {
-	messages := []openai.ChatCompletionMessage{
-		{Role: openai.ChatMessageRoleSystem, Content: req.SystemMessage},
-		{Role: openai.ChatMessageRoleUser, Content: req.UserMessage},
-	}
-
-	temp := float32(temperatureValue(req.Temperature))
-	stream, err := c.client.CreateChatCompletionStream(ctx, openai.ChatCompletionRequest{
-		Model:       req.Model,
-		Messages:    messages,
-		Temperature: temp,
+	var stream *openai.ChatCompletionStream
+	err := c.withRetry(ctx, func() error {
+		var err error
+		stream, err = c.client.CreateChatCompletionStream(ctx, toOpenAIRequest(req))
+		return err
 	})
 	if err != nil {
 		return nil, fmt.Errorf("chat completion stream failed: %w", err)
@@ -122,6 +146,21 @@ func (c *OpenAIClient) ChatCompletionStream(ctx context.Context, req ChatRequest
 	return &StreamReader{stream: stream}, nil
 }
 
+// toOpenAIRequest builds the API request. The system message always comes
+// first and is sent verbatim, so every question of a suite shares a
+// byte-identical prompt prefix that servers with prefix caching (vLLM,
+// llama.cpp) can reuse instead of recomputing.
+func toOpenAIRequest(req ChatRequest) openai.ChatCompletionRequest {
+	return openai.ChatCompletionRequest{
+		Model: req.Model,
+		Messages: []openai.ChatCompletionMessage{
+			{Role: openai.ChatMessageRoleSystem, Content: req.SystemMessage},
+			{Role: openai.ChatMessageRoleUser, Content: req.UserMessage},
+		},
+		Temperature: float32(temperatureValue(req.Temperature)),
+	}
+}
+
 // temperatureValue returns the float64 temperature value, defaulting to 0 if nil.
 func temperatureValue(t *float64) float64 {
 	if t != nil {
@@ -1,8 +1,10 @@
 package llm
 
 import (
+	"net/http"
 	"testing"
 
+	"github.com/sashabaranov/go-openai"
 	"github.com/stretchr/testify/assert"
 )
 
@@ -18,3 +20,33 @@ func TestNewOpenAIClientWithAllOptions(t *testing.T) {
 	)
 	assert.NotNil(t, client.client)
 }
+
+func TestSharedHTTPClientPoolsConnections(t *testing.T) {
+	transport, ok := sharedHTTPClient.Transport.(*http.Transport)
+	assert.True(t, ok)
+	assert.Equal(t, 64, transport.MaxIdleConnsPerHost)
+}
+
+func TestWithHTTPClient(t *testing.T) {
+	hc := &http.Client{}
+	cfg := &clientConfig{httpClient: sharedHTTPClient}
+	WithHTTPClient(hc)(cfg)
+	assert.Same(t, hc, cfg.httpClient)
+}
+
+func TestToOpenAIRequestSystemPrefix(t *testing.T) {
+	req := toOpenAIRequest(ChatRequest{
+		Model:         "m",
+		SystemMessage: "You are helpful.\n",
+		UserMessage:   "What is a Pod?",
+		Temperature:   Float64Ptr(0.5),
+	})
+
+	assert.Equal(t, "m", req.Model)
+	assert.Len(t, req.Messages, 2)
+	assert.Equal(t, openai.ChatMessageRoleSystem, req.Messages[0].Role)
+	assert.Equal(t, "You are helpful.\n", req.Messages[0].Content)
+	assert.Equal(t, openai.ChatMessageRoleUser, req.Messages[1].Role)
+	assert.Equal(t, "What is a Pod?", req.Messages[1].Content)
+	assert.Equal(t, float32(0.5), req.Temperature)
+}
@@ -1,5 +1,10 @@
 package llm
 
+import (
+	"net/http"
+	"time"
+)
+
 // Float64Ptr returns a pointer to the given float64 value.
 // Useful for constructing ChatRequest with an explicit temperature.
 func Float64Ptr(v float64) *float64 {
@@ -8,8 +13,11 @@ func Float64Ptr(v float64) *float64 {
 
 // clientConfig holds configuration for an LLM client.
 type clientConfig struct {
-	baseURL string
-	apiKey  string
+	baseURL           string
+	apiKey            string
+	httpClient        *http.Client
+	batchPollInterval time.Duration
+	maxRetries        int
 }
 
 // Option is a functional option for configuring an LLM client.
@@ -28,3 +36,30 @@ func WithAPIKey(key string) Option {
 		c.apiKey = key
 	}
 }
+
+// WithHTTPClient sets the HTTP client used for API requests.
+// By default all clients share one pooled HTTP client.
+func WithHTTPClient(hc *http.Client) Option {
+	return func(c *clientConfig) {
+		c.httpClient = hc
+	}
+}
+
+// WithBatchPollInterval sets how often batch job status is polled.
+func WithBatchPollInterval(d time.Duration) Option {
+	return func(c *clientConfig) {
+		if d > 0 {
+			c.batchPollInterval = d
+		}
+	}
+}
+
+// WithMaxRetries sets how many times a request failing with a transient error
+// (429, 5xx, connection failure) is retried. 0 disables retries.
+func WithMaxRetries(n int) Option {
+	return func(c *clientConfig) {
+		if n >= 0 {
+			c.maxRetries = n
+		}
+	}
+}
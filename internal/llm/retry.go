@@ -0,0 +1,115 @@
+package llm
+
+import (
+	"context"
+	"crypto/tls"
+	"errors"
+	"io"
+	"log/slog"
+	"math/rand"
+	"net"
+	"net/http"
+	"syscall"
+	"time"
+
+	"github.com/sashabaranov/go-openai"
+)
+
+const (
+	// defaultMaxRetries is how many times a failed request is retried.
+	defaultMaxRetries = 4
+	// defaultRetryBaseDelay is the backoff before the first retry.
+	defaultRetryBaseDelay = time.Second
+	// defaultRetryMaxDelay caps the backoff between retries.
+	defaultRetryMaxDelay = 30 * time.Second
+)
+
+// withRetry calls fn until it succeeds, fails with a non-retryable error, the
+// context is done, or maxRetries retries have been made. Delays grow
+// exponentially from retryBaseDelay up to retryMaxDelay, with jitter so that
+// concurrent requests do not retry in lockstep.
+func (c *OpenAIClient) withRetry(ctx context.Context, fn func() error) error {
+	for attempt := 0; ; attempt++ {
+		err := fn()
+		if err == nil || attempt >= c.maxRetries || !isRetryable(err) {
+			return err
+		}
+
+		delay := backoffDelay(attempt, c.retryBaseDelay, c.retryMaxDelay)
+		slog.Warn("LLM request failed, retrying",
+			"attempt", attempt+1,
+			"max_retries", c.maxRetries,
+			"delay", delay,
+			"error", err,
+		)
+
+		timer := time.NewTimer(delay)
+		select {
+		case <-ctx.Done():
+			timer.Stop()
+			return err
+		case <-timer.C:
+		}
+	}
+}
+
+// backoffDelay returns the delay before retry number attempt (0-based):
+// half of the capped exponential delay plus a random share of the other half.
+func backoffDelay(attempt int, base, maxDelay time.Duration) time.Duration {
+	d := maxDelay
+	if attempt < 32 && base<<attempt < maxDelay {
+		d = base << attempt
+	}
+	half := d / 2
+	if half <= 0 {
+		return d
+	}
+	return half + time.Duration(rand.Int63n(int64(half)+1))
+}
+
+// isRetryable reports whether err is a transient failure worth retrying:
+// rate limiting (429), server errors (5xx), timeouts and connection failures.
+// Configuration problems such as certificate errors, unknown hosts or an
+// invalid URL scheme fail immediately.
+func isRetryable(err error) bool {
+	if errors.Is(err, context.Canceled) || errors.Is(err, context.DeadlineExceeded) {
+		return false
+	}
+
+	var apiErr *openai.APIError
+	if errors.As(err, &apiErr) {
+		return retryableStatus(apiErr.HTTPStatusCode)
+	}
+	var reqErr *openai.RequestError
+	if errors.As(err, &reqErr) {
+		return retryableStatus(reqErr.HTTPStatusCode)
+	}
+
+	var certErr *tls.CertificateVerificationError
+	if errors.As(err, &certErr) {
+		return false
+	}
+	var dnsErr *net.DNSError
+	if errors.As(err, &dnsErr) && dnsErr.IsNotFound {
+		return false
+	}
+
+	// *url.Error implements net.Error for every transport failure, so only
+	// trust it when it reports a timeout.
+	var netErr net.Error
+	if errors.As(err, &netErr) && netErr.Timeout() {
+		return true
+	}
+	// Dial, read and write failures on the connection itself. TLS alerts
+	// from the peer are also reported as "remote error" OpErrors; those
+	// are not transient.
+	var opErr *net.OpError
+	if errors.As(err, &opErr) && opErr.Op != "remote error" {
+		return true
+	}
+	return errors.Is(err, io.ErrUnexpectedEOF) || errors.Is(err, syscall.ECONNRESET)
+}
+
+func retryableStatus(code int) bool {
+	return code == http.StatusTooManyRequests || code >= http.StatusInternalServerError
+}
@@ -0,0 +1,105 @@
+package llm
+
+import (
+	"context"
+	"crypto/tls"
+	"crypto/x509"
+	"errors"
+	"fmt"
+	"io"
+	"net"
+	"net/http"
+	"net/url"
+	"syscall"
+	"testing"
+	"time"
+
+	"github.com/sashabaranov/go-openai"
+	"github.com/stretchr/testify/assert"
+)
+
+// timeoutError is a net.Error that reports a timeout.
+type timeoutError struct{}
+
+func (timeoutError) Error() string   { return "i/o timeout" }
+func (timeoutError) Timeout() bool   { return true }
+func (timeoutError) Temporary() bool { return true }
+
+func TestIsRetryable(t *testing.T) {
+	tests := []struct {
+		name string
+		err  error
+		want bool
+	}{
+		{"rate limited", &openai.APIError{HTTPStatusCode: http.StatusTooManyRequests}, true},
+		{"server error", fmt.Errorf("wrapped: %w", &openai.APIError{HTTPStatusCode: http.StatusBadGateway}), true},
+		{"bad request", &openai.APIError{HTTPStatusCode: http.StatusBadRequest}, false},
+		{"request error 503", &openai.RequestError{HTTPStatusCode: http.StatusServiceUnavailable, Err: errors.New("unavailable")}, true},
+		{"request error 401", &openai.RequestError{HTTPStatusCode: http.StatusUnauthorized, Err: errors.New("unauthorized")}, false},
+		{"connection refused", &url.Error{Op: "Post", URL: "http://x", Err: &net.OpError{Op: "dial", Net: "tcp", Err: syscall.ECONNREFUSED}}, true},
+		{"connection reset", &url.Error{Op: "Post", URL: "http://x", Err: syscall.ECONNRESET}, true},
+		{"timeout", &url.Error{Op: "Post", URL: "http://x", Err: timeoutError{}}, true},
+		{"certificate error", &url.Error{Op: "Post", URL: "https://x", Err: &tls.CertificateVerificationError{Err: x509.UnknownAuthorityError{}}}, false},
+		{"tls alert", &url.Error{Op: "Post", URL: "https://x", Err: &net.OpError{Op: "remote error", Err: errors.New("tls: handshake failure")}}, false},
+		{"unsupported scheme", &url.Error{Op: "Post", URL: "htp://x", Err: errors.New(`unsupported protocol scheme "htp"`)}, false},
+		{"unknown host", &url.Error{Op: "Post", URL: "http://x", Err: &net.OpError{Op: "dial", Net: "tcp", Err: &net.DNSError{Err: "no such host", Name: "x", IsNotFound: true}}}, false},
+		{"unexpected EOF", io.ErrUnexpectedEOF, true},
+		{"context cancelled", &url.Error{Op: "Post", URL: "http://x", Err: context.Canceled}, false},
+		{"plain error", errors.New("boom"), false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			assert.Equal(t, tt.want, isRetryable(tt.err))
+		})
+	}
+}
+
+func TestWithRetry(t *testing.T) {
+	c := &OpenAIClient{maxRetries: 3, retryBaseDelay: time.Millisecond, retryMaxDelay: 5 * time.Millisecond}
+
+	calls := 0
+	err := c.withRetry(context.Background(), func() error {
+		calls++
+		if calls < 3 {
+			return &openai.APIError{HTTPStatusCode: http.StatusServiceUnavailable}
+		}
+		return nil
+	})
+	assert.NoError(t, err)
+	assert.Equal(t, 3, calls)
+}
+
+func TestWithRetryGivesUp(t *testing.T) {
+	c := &OpenAIClient{maxRetries: 2, retryBaseDelay: time.Millisecond, retryMaxDelay: 5 * time.Millisecond}
+
+	calls := 0
+	err := c.withRetry(context.Background(), func() error {
+		calls++
+		return &openai.APIError{HTTPStatusCode: http.StatusTooManyRequests}
+	})
+	assert.Error(t, err)
+	assert.Equal(t, 3, calls) // initial attempt + 2 retries
+}
+
+func TestWithRetryNonRetryable(t *testing.T) {
+	c := &OpenAIClient{maxRetries: 5, retryBaseDelay: time.Millisecond, retryMaxDelay: 5 * time.Millisecond}
+
+	calls := 0
+	err := c.withRetry(context.Background(), func() error {
+		calls++
+		return &openai.APIError{HTTPStatusCode: http.StatusBadRequest}
+	})
+	assert.Error(t, err)
+	assert.Equal(t, 1, calls)
+}
+
+func TestBackoffDelay(t *testing.T) {
+	for attempt := 0; attempt < 10; attempt++ {
+		d := backoffDelay(attempt, time.Second, 30*time.Second)
+		assert.LessOrEqual(t, d, 30*time.Second)
+		assert.GreaterOrEqual(t, d, time.Second/2)
+	}
+	assert.LessOrEqual(t, backoffDelay(0, time.Second, 30*time.Second), time.Second)
+	assert.GreaterOrEqual(t, backoffDelay(3, time.Second, 30*time.Second), 4*time.Second)
+}
@@ -3,6 +3,7 @@ package mcp
 import (
 	"context"
 	"encoding/json"
+	"fmt"
 	"os"
 	"path/filepath"
 	"testing"
@@ -10,7 +11,13 @@ import (
 	"github.com/mark3labs/mcp-go/mcp"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/runtime"
+	"k8s.io/apimachinery/pkg/runtime/schema"
+	dynamicfake "k8s.io/client-go/dynamic/fake"
+	k8stesting "k8s.io/client-go/testing"
 
+	"github.com/giantswarm/llm-testing/internal/kserve"
 	"github.com/giantswarm/llm-testing/internal/server"
 	"github.com/giantswarm/llm-testing/internal/testutil"
 )
@@ -426,6 +433,45 @@ func TestHandleDeployModelNoManagerTakesPrecedence(t *testing.T) {
 	assert.Contains(t, content.Text, "KServe manager is not configured")
 }
 
+func TestHandleDeployModelAppendsRuntimeArgs(t *testing.T) {
+	client := dynamicfake.NewSimpleDynamicClientWithCustomListKinds(runtime.NewScheme(),
+		map[schema.GroupVersionResource]string{
+			{Group: "serving.kserve.io", Version: "v1beta1", Resource: "inferenceservices"}: "InferenceServiceList",
+		},
+	)
+
+	// Capture the created InferenceService and fail the create, so the
+	// handler returns without waiting for the model to become ready.
+	var created *unstructured.Unstructured
+	client.PrependReactor("create", "inferenceservices", func(action k8stesting.Action) (bool, runtime.Object, error) {
+		created = action.(k8stesting.CreateAction).GetObject().(*unstructured.Unstructured)
+		return true, nil, fmt.Errorf("create rejected by test")
+	})
+
+	sc := &server.ServerContext{
+		KServeManager: kserve.NewManagerWithClient(client, "test-namespace"),
+	}
+
+	request := mcp.CallToolRequest{}
+	request.Params.Arguments = map[string]interface{}{
+		"model_name":   "test",
+		"model_uri":    "hf://org/model",
+		"runtime_args": []interface{}{"--max-model-len=4096", "--no-enable-prefix-caching"},
+	}
+
+	result, err := handleDeployModel(context.Background(), request, sc)
+	require.NoError(t, err)
+	assert.True(t, result.IsError)
+
+	require.NotNil(t, created)
+	args, found, err := unstructured.NestedStringSlice(created.Object, "spec", "predictor", "model", "args")
+	require.NoError(t, err)
+	require.True(t, found)
+
+	expected := append(append([]string(nil), kserve.DefaultRuntimeArgs...), "--max-model-len=4096", "--no-enable-prefix-caching")
+	assert.Equal(t, expected, args)
+}
+
 func TestHandleRunTestSuiteSuccess(t *testing.T) {
 	tmpDir := t.TempDir()
 	client := &testutil.MockLLMClient{
@@ -25,7 +25,7 @@ func registerTestSuiteTools(s *mcpserver.MCPServer, sc *server.ServerContext) er
 	runTool := mcp.NewTool("run_test_suite",
 		mcp.WithDescription(`Execute a test suite against one or more models. Models are specified at runtime -- they are NOT part of the test suite configuration.
 
-When models have a 'model_uri', they can be automatically deployed via KServe InferenceService before testing and torn down afterwards. Models are tested sequentially to respect GPU memory constraints.
+When models have a 'model_uri', they can be automatically deployed via KServe InferenceService before testing and torn down afterwards. Models are tested sequentially to respect GPU memory constraints, unless 'parallel_models' is set.
 
 Use 'models' for multi-model configs (JSON array) or 'model' for a single model.`),
 		mcp.WithString("test_suite",
@@ -53,6 +53,18 @@ Example: [{"name":"mistral-7b","model_uri":"hf://mistralai/Mistral-7B-Instruct-v
 		mcp.WithBoolean("deploy",
 			mcp.Description("Whether to auto-deploy models with model_uri via KServe (default: true)"),
 		),
+		mcp.WithNumber("concurrency",
+			mcp.Description("Maximum number of questions sent to a model in parallel (default: 16)"),
+		),
+		mcp.WithNumber("requests_per_minute",
+			mcp.Description("Maximum number of questions sent per minute across all models (default: unlimited)"),
+		),
+		mcp.WithBoolean("parallel_models",
+			mcp.Description("Evaluate all models at the same time instead of one after another (default: false). Only use when every model can be served simultaneously."),
+		),
+		mcp.WithString("resume_run_id",
+			mcp.Description("Run ID of an interrupted run to continue. Questions already answered in that run are skipped."),
+		),
 	)
 	s.AddTool(runTool, func(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
 		return handleRunTestSuite(ctx, request, sc)
@@ -73,6 +85,15 @@ Example: [{"name":"mistral-7b","model_uri":"hf://mistralai/Mistral-7B-Instruct-v
 		mcp.WithNumber("repetitions",
 			mcp.Description("Number of scoring repetitions for confidence (default: 3)"),
 		),
+		mcp.WithBoolean("batch",
+			mcp.Description("Submit all repetitions as one OpenAI Batch API job (default: false). Cheaper for hosted providers, but the call blocks until the batch completes, which may take hours."),
+		),
+		mcp.WithNumber("max_chunk_chars",
+			mcp.Description("Results larger than this many characters are scored in chunks of whole questions and the scores summed (default: 50000)"),
+		),
+		mcp.WithNumber("concurrency",
+			mcp.Description("Maximum number of scoring requests sent in parallel (default: 8)"),
+		),
 	)
 	s.AddTool(scoreTool, func(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
 		return handleScoreResults(ctx, request, sc)
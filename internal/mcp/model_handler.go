@@ -29,7 +29,7 @@ func registerModelTools(s *mcpserver.MCPServer, sc *server.ServerContext) error
 			mcp.Description("Number of GPUs to request (default: 1)"),
 		),
 		mcp.WithArray("runtime_args",
-			mcp.Description("Optional runtime arguments for the serving runtime (e.g. ['--max-model-len=4096'])"),
+			mcp.Description("Optional runtime arguments for the serving runtime, appended to the defaults (--enable-prefix-caching) (e.g. ['--max-model-len=4096']). To disable prefix caching pass '--no-enable-prefix-caching' (requires a vLLM version that supports it)."),
 			mcp.WithStringItems(),
 		),
 	)
@@ -95,7 +95,11 @@ func handleDeployModel(ctx context.Context, request mcp.CallToolRequest, sc *ser
 			}
 			runtimeArgs = append(runtimeArgs, argStr)
 		}
-		cfg.RuntimeArgs = runtimeArgs
+		// User args are appended after the defaults. Value flags given again
+		// override the default value, but store-true defaults such as
+		// --enable-prefix-caching can only be turned off with their negated
+		// form (--no-enable-prefix-caching, on vLLM versions that support it).
+		cfg.RuntimeArgs = append(cfg.RuntimeArgs, runtimeArgs...)
 	}
 
 	status, err := sc.KServeManager.Deploy(ctx, cfg)
@@ -56,7 +56,7 @@ func handleRunTestSuite(ctx context.Context, request mcp.CallToolRequest, sc *se
 
 	// When KServe is available and models have model_uri, set up the
 	// deploy -> test -> teardown lifecycle. Models are processed sequentially
-	// to respect GPU memory constraints.
+	// to respect GPU memory constraints, unless parallel_models is set below.
 	if sc.KServeManager != nil {
 		r.SetClientForModelFunc(func(ctx context.Context, model testsuite.Model) (llm.Client, error) {
 			return clientForModel(ctx, sc, model, args, deployEnabled)
@@ -71,6 +71,22 @@ func handleRunTestSuite(ctx context.Context, request mcp.CallToolRequest, sc *se
 		}
 	}
 
+	if concurrency, ok := args["concurrency"].(float64); ok && concurrency > 0 {
+		r.SetConcurrency(int(concurrency))
+	}
+	if rpm, ok := args["requests_per_minute"].(float64); ok && rpm > 0 {
+		r.SetRequestsPerMinute(int(rpm))
+	}
+	if parallel, ok := args["parallel_models"].(bool); ok {
+		r.SetParallelModels(parallel)
+	}
+	if resumeID, ok := args["resume_run_id"].(string); ok && resumeID != "" {
+		if _, err := resolveRunPath(sc.OutputDir, resumeID); err != nil {
+			return mcp.NewToolResultError(fmt.Sprintf("invalid resume_run_id: %v", err)), nil
+		}
+		r.SetResumeRunID(resumeID)
+	}
+
 	progressEvents := make([]map[string]interface{}, 0)
 	r.SetProgressFunc(func(model string, questionIndex, totalQuestions int) {
 		if questionIndex == 1 || questionIndex == totalQuestions || questionIndex%10 == 0 {
@@ -41,6 +41,15 @@ func handleScoreResults(ctx context.Context, request mcp.CallToolRequest, sc *se
 	if reps, ok := args["repetitions"].(float64); ok && reps > 0 {
 		cfg.Repetitions = int(reps)
 	}
+	if batch, ok := args["batch"].(bool); ok {
+		cfg.Batch = batch
+	}
+	if maxChunkChars, ok := args["max_chunk_chars"].(float64); ok && maxChunkChars > 0 {
+		cfg.MaxChunkChars = int(maxChunkChars)
+	}
+	if concurrency, ok := args["concurrency"].(float64); ok && concurrency > 0 {
+		cfg.Concurrency = int(concurrency)
+	}
 
 	s := scorer.NewScorer(sc.LLMClient, cfg)
 
@@ -0,0 +1,160 @@
+package runner
+
+import (
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io/fs"
+	"log/slog"
+	"os"
+	"sync"
+	"time"
+
+	"github.com/giantswarm/llm-testing/internal/testsuite"
+)
+
+// checkpointEntry is one answered question in a model's checkpoint file.
+// Besides the question ID, it records everything else the answer depends on,
+// so that it is not reused after the question text, the temperature or the
+// system prompt changed (e.g. the questions CSV was edited).
+type checkpointEntry struct {
+	QuestionID  string  `json:"qid"`
+	Question    string  `json:"question"`
+	Temperature float64 `json:"temperature"`
+	PromptHash  string  `json:"prompt_hash"`
+	Answer      string  `json:"answer"`
+	Duration    float64 `json:"duration"` // seconds
+}
+
+// promptHash identifies a system prompt in checkpoint entries without
+// repeating it on every line.
+func promptHash(systemPrompt string) string {
+	sum := sha256.Sum256([]byte(systemPrompt))
+	return hex.EncodeToString(sum[:])
+}
+
+// matches reports whether the entry is a valid answer to q when asked with
+// the given temperature and system prompt hash.
+func (e checkpointEntry) matches(q testsuite.Question, temperature float64, promptHash string) bool {
+	return e.Question == q.QuestionText && e.Temperature == temperature && e.PromptHash == promptHash
+}
+
+// loadCheckpoint reads the answered questions from a checkpoint file, keyed by
+// question ID. A missing file yields an empty map. A trailing partial line left
+// by an interrupted write is discarded and truncated away, so that appending
+// new entries keeps the file well-formed.
+func loadCheckpoint(path string) (map[string]checkpointEntry, error) {
+	done := make(map[string]checkpointEntry)
+
+	data, err := os.ReadFile(path)
+	if errors.Is(err, fs.ErrNotExist) {
+		return done, nil
+	}
+	if err != nil {
+		return nil, err
+	}
+
+	complete := bytes.LastIndexByte(data, '\n') + 1
+	if complete < len(data) {
+		slog.Warn("discarding incomplete checkpoint entry", "file", path)
+		if err := os.Truncate(path, int64(complete)); err != nil {
+			return nil, err
+		}
+	}
+
+	for n, line := range bytes.Split(data[:complete], []byte("\n")) {
+		if len(line) == 0 {
+			continue
+		}
+		var e checkpointEntry
+		if err := json.Unmarshal(line, &e); err != nil {
+			return nil, fmt.Errorf("%s:%d: %w", path, n+1, err)
+		}
+		done[e.QuestionID] = e
+	}
+	return done, nil
+}
+
+// resumedResults returns one result slot per question, filled in from done
+// where the checkpointed answer still applies: same question text, temperature
+// and system prompt.
+func resumedResults(model testsuite.Model, questions []testsuite.Question, systemPrompt string, done map[string]checkpointEntry) []*testsuite.Result {
+	results := make([]*testsuite.Result, len(questions))
+	hash := promptHash(systemPrompt)
+	answered, stale := 0, 0
+	for i, q := range questions {
+		e, ok := done[q.ID]
+		if !ok {
+			continue
+		}
+		if !e.matches(q, model.Temperature, hash) {
+			stale++
+			continue
+		}
+		results[i] = e.result(q)
+		answered++
+	}
+	if stale > 0 {
+		slog.Warn("ignoring checkpointed answers asked with a different question text, temperature or system prompt", "model", model.Name, "count", stale)
+	}
+	if answered > 0 {
+		slog.Info("skipping questions answered in a previous attempt", "model", model.Name, "answered", answered)
+	}
+	return results
+}
+
+// checkpointWriter appends answered questions to a checkpoint file, one JSON
+// object per line, stamped with the temperature and system prompt hash they
+// were asked with. It is safe for concurrent use.
+type checkpointWriter struct {
+	mu          sync.Mutex
+	f           *os.File
+	temperature float64
+	promptHash  string
+}
+
+func openCheckpoint(path string, temperature float64, promptHash string) (*checkpointWriter, error) {
+	f, err := os.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0o644)
+	if err != nil {
+		return nil, err
+	}
+	return &checkpointWriter{f: f, temperature: temperature, promptHash: promptHash}, nil
+}
+
+// Write appends result as a single line. Each line goes straight to the file
+// without buffering, so an interrupted run loses at most the entry being written.
+func (c *checkpointWriter) Write(result *testsuite.Result) error {
+	line, err := json.Marshal(checkpointEntry{
+		QuestionID:  result.Question.ID,
+		Question:    result.Question.QuestionText,
+		Temperature: c.temperature,
+		PromptHash:  c.promptHash,
+		Answer:      result.Answer,
+		Duration:    result.Duration.Seconds(),
+	})
+	if err != nil {
+		return err
+	}
+	line = append(line, '\n')
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	_, err = c.f.Write(line)
+	return err
+}
+
+func (c *checkpointWriter) Close() error {
+	return c.f.Close()
+}
+
+// result rebuilds the Result for q from a checkpoint entry.
+func (e checkpointEntry) result(q testsuite.Question) *testsuite.Result {
+	return &testsuite.Result{
+		Question: q,
+		Answer:   e.Answer,
+		Duration: time.Duration(e.Duration * float64(time.Second)),
+	}
+}
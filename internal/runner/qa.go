@@ -3,7 +3,7 @@ package runner
 import (
 	"context"
 	"fmt"
-	"strings"
+	"io"
 	"time"
 
 	"github.com/giantswarm/llm-testing/internal/llm"
@@ -44,14 +44,12 @@ func (s *QAStrategy) Execute(ctx context.Context, client llm.Client, model strin
 	}, nil
 }
 
-func (s *QAStrategy) FormatResults(results []*testsuite.Result) string {
-	var b strings.Builder
-	for _, r := range results {
-		fmt.Fprintf(&b, "---\n")
-		fmt.Fprintf(&b, "NO. %s - %s\n", r.Question.ID, r.Question.Section)
-		fmt.Fprintf(&b, "QUESTION: %s\n", r.Question.QuestionText)
-		fmt.Fprintf(&b, "EXPECTED ANSWER: %s\n", r.Question.ExpectedAnswer)
-		fmt.Fprintf(&b, "ACTUAL ANSWER: %s\n", r.Answer)
-	}
-	return b.String()
+func (s *QAStrategy) WriteResult(w io.Writer, r *testsuite.Result) error {
+	_, err := fmt.Fprintf(w, "---\nNO. %s - %s\nQUESTION: %s\nEXPECTED ANSWER: %s\nACTUAL ANSWER: %s\n",
+		r.Question.ID, r.Question.Section,
+		r.Question.QuestionText,
+		r.Question.ExpectedAnswer,
+		r.Answer,
+	)
+	return err
 }
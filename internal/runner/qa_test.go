@@ -2,6 +2,7 @@ package runner
 
 import (
 	"context"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -33,6 +34,17 @@ func TestQAStrategyLoadQuestionsEmpty(t *testing.T) {
 	assert.Error(t, err)
 }
 
+// formatResults renders results with the strategy's WriteResult, as the
+// runner does when writing a results file.
+func formatResults(t *testing.T, s EvaluationStrategy, results []*testsuite.Result) string {
+	t.Helper()
+	var b strings.Builder
+	for _, r := range results {
+		require.NoError(t, s.WriteResult(&b, r))
+	}
+	return b.String()
+}
+
 func TestQAStrategyFormatResults(t *testing.T) {
 	s := &QAStrategy{}
 
@@ -48,7 +60,7 @@ func TestQAStrategyFormatResults(t *testing.T) {
 		},
 	}
 
-	output := s.FormatResults(results)
+	output := formatResults(t, s, results)
 	assert.Contains(t, output, "NO. 1 - Setup")
 	assert.Contains(t, output, "QUESTION: What is kubectl?")
 	assert.Contains(t, output, "EXPECTED ANSWER: CLI tool")
@@ -90,3 +102,22 @@ func TestQAStrategyExecutePassesSystemPrompt(t *testing.T) {
 	require.NoError(t, err)
 	assert.Equal(t, "custom system prompt", client.LastRequest.SystemMessage)
 }
+
+func TestQAStrategyWriteResult(t *testing.T) {
+	s := &QAStrategy{}
+
+	var b strings.Builder
+	err := s.WriteResult(&b, &testsuite.Result{
+		Question: testsuite.Question{
+			ID:             "7",
+			Section:        "Pods",
+			QuestionText:   "What is a Pod?",
+			ExpectedAnswer: "Smallest deployable unit",
+		},
+		Answer: "A group of containers",
+	})
+	require.NoError(t, err)
+
+	expected := "---\nNO. 7 - Pods\nQUESTION: What is a Pod?\nEXPECTED ANSWER: Smallest deployable unit\nACTUAL ANSWER: A group of containers\n"
+	assert.Equal(t, expected, b.String())
+}
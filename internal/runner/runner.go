@@ -1,20 +1,31 @@
 package runner
 
 import (
+	"bufio"
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"log/slog"
 	"os"
 	"path/filepath"
+	"slices"
 	"strings"
+	"sync"
 	"time"
 
+	"golang.org/x/time/rate"
+
 	"github.com/giantswarm/llm-testing/internal/llm"
 	"github.com/giantswarm/llm-testing/internal/testsuite"
 )
 
+// DefaultConcurrency is the default number of questions sent to a model in parallel.
+const DefaultConcurrency = 16
+
 // ProgressFunc is called to report progress during test execution.
+// questionIndex is the number of questions completed so far for the model.
+// Calls are serialized, so implementations do not need to be goroutine-safe.
 type ProgressFunc func(model string, questionIndex, totalQuestions int)
 
 // ClientForModelFunc returns an LLM client configured for the given model.
@@ -36,15 +47,56 @@ type Runner struct {
 	strategy       EvaluationStrategy
 	outputDir      string
 	progress       ProgressFunc
+	progressMu     sync.Mutex    // serializes progress callbacks across goroutines
+	concurrency    int           // max in-flight questions per model
+	limiter        *rate.Limiter // optional: caps request rate across all models
+	parallelModels bool          // evaluate all models at once instead of one after another
+	resumeRunID    string        // optional: continue this run instead of starting a new one
 }
 
 // NewRunner creates a new test runner with a default LLM client.
 func NewRunner(client llm.Client, strategy EvaluationStrategy, outputDir string) *Runner {
 	return &Runner{
-		client:    client,
-		strategy:  strategy,
-		outputDir: outputDir,
+		client:      client,
+		strategy:    strategy,
+		outputDir:   outputDir,
+		concurrency: DefaultConcurrency,
+	}
+}
+
+// SetConcurrency sets the maximum number of questions sent to a model in parallel.
+// Values below 1 are treated as 1 (sequential execution).
+func (r *Runner) SetConcurrency(n int) {
+	if n < 1 {
+		n = 1
 	}
+	r.concurrency = n
+}
+
+// SetRequestsPerMinute limits how many questions are sent per minute, across
+// all models of a run. Use it for hosted APIs with rate limits or backends that
+// degrade under bursts. A value of 0 or less removes the limit.
+func (r *Runner) SetRequestsPerMinute(rpm int) {
+	if rpm <= 0 {
+		r.limiter = nil
+		return
+	}
+	r.limiter = rate.NewLimiter(rate.Every(time.Minute/time.Duration(rpm)), 1)
+}
+
+// SetParallelModels enables evaluating all models concurrently. This is only
+// sensible when the endpoint(s) can serve every model at once, e.g. a
+// multi-model server or one pre-deployed endpoint per model; with KServe
+// deploy/teardown it requires GPU capacity for all models simultaneously.
+func (r *Runner) SetParallelModels(enabled bool) {
+	r.parallelModels = enabled
+}
+
+// SetResumeRunID makes the next Run continue an earlier, interrupted run: its
+// output directory is reused and questions already recorded in the per-model
+// checkpoint files are not asked again. An empty ID starts a new run.
+func (r *Runner) SetResumeRunID(runID string) {
+	r.resumeRunID = runID
 }
 
 // SetProgressFunc sets the progress callback.
@@ -67,8 +119,10 @@ func (r *Runner) SetAfterModelFunc(fn AfterModelFunc) {
 }
 
 // Run executes a test suite for the given models and writes results.
-// Models are processed sequentially -- important for GPU memory constraints
-// when models are deployed/torn down via KServe between evaluations.
+// Models are processed sequentially by default -- important for GPU memory
+// constraints when models are deployed/torn down via KServe between evaluations.
+// See SetParallelModels to evaluate them concurrently instead.
+// Questions within a model are sent concurrently, bounded by the runner's concurrency.
 func (r *Runner) Run(ctx context.Context, suite *testsuite.TestSuite, models []testsuite.Model) (*testsuite.TestRun, error) {
 	if len(models) == 0 {
 		return nil, fmt.Errorf("no models specified for test run")
@@ -80,12 +134,21 @@ func (r *Runner) Run(ctx context.Context, suite *testsuite.TestSuite, models []t
 	}
 
 	timestamp := time.Now()
-	sanitizedName := strings.ReplaceAll(suite.Name, " ", "_")
-	runID := fmt.Sprintf("%s_%s", sanitizedName, timestamp.Format("20060102-150405"))
+	runID := r.resumeRunID
+	if runID == "" {
+		sanitizedName := strings.ReplaceAll(suite.Name, " ", "_")
+		runID = fmt.Sprintf("%s_%s", sanitizedName, timestamp.Format("20060102-150405"))
+	} else if filepath.Base(runID) != runID || runID == "." || runID == ".." {
+		return nil, fmt.Errorf("invalid run ID to resume: %q", runID)
+	}
 
-	// Create output directory.
 	outputPath := filepath.Join(r.outputDir, runID)
-	if err := os.MkdirAll(outputPath, 0o755); err != nil {
+	if r.resumeRunID != "" {
+		if _, err := os.Stat(outputPath); err != nil {
+			return nil, fmt.Errorf("cannot resume run %q: %w", runID, err)
+		}
+		slog.Info("resuming test run", "run_id", runID)
+	} else if err := os.MkdirAll(outputPath, 0o755); err != nil {
 		return nil, fmt.Errorf("failed to create output directory: %w", err)
 	}
 
@@ -96,19 +159,118 @@ func (r *Runner) Run(ctx context.Context, suite *testsuite.TestSuite, models []t
 		Models:    make([]testsuite.ModelRun, 0, len(models)),
 	}
 
+	stems, err := resultFileStems(models)
+	if err != nil {
+		return nil, err
+	}
+
 	systemPrompt := suite.Prompt.SystemMessage
 
-	for _, model := range models {
-		// Check for context cancellation between models.
-		if err := ctx.Err(); err != nil {
-			slog.Warn("test run cancelled before model evaluation", "model", model.Name)
-			break
+	if r.parallelModels {
+		modelRuns := make([]*testsuite.ModelRun, len(models))
+		errs := make([]error, len(models))
+
+		var wg sync.WaitGroup
+		for i, model := range models {
+			wg.Add(1)
+			go func(i int, model testsuite.Model) {
+				defer wg.Done()
+				modelRuns[i], errs[i] = r.runModel(ctx, model, questions, systemPrompt, outputPath, stems[i])
+			}(i, model)
+		}
+		wg.Wait()
+
+		// Report the first failure in model order, like the sequential path.
+		for i := range models {
+			if errs[i] != nil {
+				return nil, errs[i]
+			}
+			run.Models = append(run.Models, *modelRuns[i])
+		}
+	} else {
+		for i, model := range models {
+			// Check for context cancellation between models.
+			if err := ctx.Err(); err != nil {
+				slog.Warn("test run cancelled before model evaluation", "model", model.Name)
+				break
+			}
+
+			modelRun, err := r.runModel(ctx, model, questions, systemPrompt, outputPath, stems[i])
+			if err != nil {
+				return nil, err
+			}
+			run.Models = append(run.Models, *modelRun)
+		}
+	}
+
+	run.Duration = time.Since(timestamp)
+
+	// Write metadata.
+	if err := writeRunMetadata(outputPath, run); err != nil {
+		return nil, fmt.Errorf("failed to write run metadata: %w", err)
+	}
+
+	return run, nil
+}
+
+// resultFileStems returns the base name of each model's results and checkpoint
+// files. It is the sanitized model name, extended with the temperature when
+// several models share that name (e.g. one model at two temperatures). Models
+// that would still share files are rejected.
+func resultFileStems(models []testsuite.Model) ([]string, error) {
+	count := make(map[string]int, len(models))
+	for _, m := range models {
+		count[sanitizeFilename(m.Name)]++
+	}
+
+	stems := make([]string, len(models))
+	owner := make(map[string]int, len(models))
+	for i, m := range models {
+		stem := sanitizeFilename(m.Name)
+		if count[stem] > 1 {
+			stem = fmt.Sprintf("%s_temp%g", stem, m.Temperature)
+		}
+		if j, ok := owner[stem]; ok {
+			return nil, fmt.Errorf("models %q and %q (temperature %g) would write to the same results file", models[j].Name, m.Name, m.Temperature)
+		}
+		owner[stem] = i
+		stems[i] = stem
+	}
+	return stems, nil
+}
+
+// runModel evaluates all questions against a single model, writes its results
+// file (fileStem.txt) into outputPath and calls the afterModel hook.
+func (r *Runner) runModel(ctx context.Context, model testsuite.Model, questions []testsuite.Question, systemPrompt, outputPath, fileStem string) (*testsuite.ModelRun, error) {
+	// Answers are checkpointed as they arrive so an interrupted run can be
+	// resumed. Only a resumed run reuses them. The checkpoint is prepared
+	// before the model is deployed, so that a broken checkpoint fails fast and
+	// a model with nothing left to ask is not deployed at all.
+	checkpointFile := filepath.Join(outputPath, fileStem+".jsonl")
+	var done map[string]checkpointEntry
+	if r.resumeRunID != "" {
+		var err error
+		done, err = loadCheckpoint(checkpointFile)
+		if err != nil {
+			return nil, fmt.Errorf("failed to read checkpoint for model %s: %w", model.Name, err)
+		}
+	}
+	results := resumedResults(model, questions, systemPrompt, done)
+
+	checkpoint, err := openCheckpoint(checkpointFile, model.Temperature, promptHash(systemPrompt))
+	if err != nil {
+		return nil, fmt.Errorf("failed to open checkpoint for model %s: %w", model.Name, err)
+	}
+	defer func() {
+		if err := checkpoint.Close(); err != nil {
+			slog.Error("failed to close checkpoint", "model", model.Name, "error", err)
 		}
+	}()
 
+	client := r.client
+	if needsRequests(questions, results) {
 		// Determine the LLM client for this model.
-		client := r.client
 		if r.clientForModel != nil {
-			var err error
 			client, err = r.clientForModel(ctx, model)
 			if err != nil {
 				slog.Error("failed to get client for model", "model", model.Name, "error", err)
@@ -120,77 +282,283 @@ func (r *Runner) Run(ctx context.Context, suite *testsuite.TestSuite, models []t
 			}
 		}
 
-		slog.Info("running test suite",
-			"model", model.Name,
-			"questions", len(questions),
-			"temperature", model.Temperature,
-		)
+		// Call afterModel hook (e.g. teardown KServe InferenceService) however
+		// the evaluation ends.
+		if r.afterModel != nil {
+			defer func() {
+				if err := r.afterModel(ctx, model); err != nil {
+					slog.Error("after-model hook failed", "model", model.Name, "error", err)
+					// Don't fail the entire run.
+				}
+			}()
+		}
+	} else {
+		slog.Info("all questions answered in a previous attempt, not sending any", "model", model.Name)
+	}
 
-		modelStart := time.Now()
-		var results []*testsuite.Result
+	slog.Info("running test suite",
+		"model", model.Name,
+		"questions", len(questions),
+		"temperature", model.Temperature,
+	)
 
-		for i, q := range questions {
-			// Check for context cancellation between questions.
-			if err := ctx.Err(); err != nil {
-				slog.Warn("test run cancelled", "model", model.Name, "completed", i, "total", len(questions))
-				break
+	modelStart := time.Now()
+
+	// Results are written in question order while later questions are still
+	// in flight.
+	resultsFile := filepath.Join(outputPath, fileStem+".txt")
+	err = writeResultsFile(resultsFile, func(w io.Writer) error {
+		var err error
+		results, err = r.executeQuestions(ctx, client, model, questions, systemPrompt, results, checkpoint, w)
+		return err
+	})
+	if err != nil {
+		return nil, fmt.Errorf("failed to write results for model %s: %w", model.Name, err)
+	}
+
+	modelRun := &testsuite.ModelRun{
+		ModelName:   model.Name,
+		Duration:    time.Since(modelStart),
+		ResultsFile: resultsFile,
+		Results:     results,
+	}
+
+	slog.Info("model evaluation complete",
+		"model", model.Name,
+		"questions_answered", len(results),
+		"duration", modelRun.Duration,
+	)
+
+	return modelRun, nil
+}
+
+// needsRequests reports whether any question is left to ask: it has no result
+// and no answered question shares its text.
+func needsRequests(questions []testsuite.Question, results []*testsuite.Result) bool {
+	answered := make(map[string]bool, len(questions))
+	for i, res := range results {
+		if res != nil {
+			answered[questions[i].QuestionText] = true
+		}
+	}
+	for i, q := range questions {
+		if results[i] == nil && !answered[q.QuestionText] {
+			return true
+		}
+	}
+	return false
+}
+
+// executeQuestions sends all questions to the model with up to r.concurrency
+// requests in flight, subject to the optional rate limit. results holds one
+// slot per question, pre-filled with answers from a previous attempt; those
+// questions are not sent again. Every new answer is appended to checkpoint.
+// Questions with identical text are sent once and share the answer, since the
+// system prompt, model and temperature are the same for the whole run.
+// Results are written to w in question order as soon as each one and all
+// before it are available, and returned in the same order; failed questions
+// are logged and omitted.
+func (r *Runner) executeQuestions(ctx context.Context, client llm.Client, model testsuite.Model, questions []testsuite.Question, systemPrompt string, results []*testsuite.Result, checkpoint *checkpointWriter, w io.Writer) ([]*testsuite.Result, error) {
+	sem := make(chan struct{}, r.concurrency)
+
+	var (
+		wg        sync.WaitGroup
+		completed int // guarded by r.progressMu
+	)
+
+	for _, res := range results {
+		if res != nil {
+			completed++
+		}
+	}
+
+	// leader[i] is the first question with the same text as question i; only
+	// leaders are sent.
+	leader := make([]int, len(questions))
+	firstByText := make(map[string]int, len(questions))
+	duplicates := 0
+	for i, q := range questions {
+		l, ok := firstByText[q.QuestionText]
+		if !ok {
+			l = i
+			firstByText[q.QuestionText] = i
+		} else {
+			duplicates++
+		}
+		leader[i] = l
+	}
+	if duplicates > 0 {
+		slog.Info("asking duplicate questions once", "model", model.Name, "duplicates", duplicates)
+	}
+
+	// Duplicates of questions answered from the checkpoint need no request.
+	// waiting[l] counts the questions still waiting for leader l's answer, so
+	// that its completion advances progress by that many.
+	waiting := make([]int, len(questions))
+	for i, q := range questions {
+		l := leader[i]
+		if results[i] != nil {
+			continue
+		}
+		if results[l] != nil {
+			results[i] = duplicateResult(q, results[l], checkpoint)
+			completed++
+			continue
+		}
+		waiting[l]++
+	}
+
+	// Report what a resumed run already has, so progress starts (and, if
+	// nothing is left to ask, ends) at the right count.
+	if completed > 0 && r.progress != nil {
+		r.progressMu.Lock()
+		r.progress(model.Name, completed, len(questions))
+		r.progressMu.Unlock()
+	}
+
+	// ready[l] is closed once leader l's result is final: answered from the
+	// checkpoint, finished (successfully or not), or never sent. started
+	// tracks which leaders are already covered, so every channel is closed once.
+	ready := make([]chan struct{}, len(questions))
+	started := make([]bool, len(questions))
+	for i := range questions {
+		if leader[i] != i {
+			continue
+		}
+		ready[i] = make(chan struct{})
+		if results[i] != nil {
+			close(ready[i])
+			started[i] = true
+		}
+	}
+
+	writeErr := make(chan error, 1)
+	go func() {
+		writeErr <- r.writeInOrder(w, questions, results, leader, ready, checkpoint)
+	}()
+
+dispatch:
+	for i, q := range questions {
+		if leader[i] != i || started[i] {
+			continue
+		}
+
+		// Wait for a free slot, stopping early on context cancellation.
+		select {
+		case <-ctx.Done():
+			slog.Warn("test run cancelled", "model", model.Name, "dispatched", i, "total", len(questions))
+			break dispatch
+		case sem <- struct{}{}:
+		}
+
+		// Take a rate-limit token only once a slot is free, so tokens are not
+		// spent long before the request is actually sent.
+		if r.limiter != nil {
+			if err := r.limiter.Wait(ctx); err != nil {
+				<-sem
+				slog.Warn("test run cancelled", "model", model.Name, "dispatched", i, "total", len(questions))
+				break dispatch
 			}
+		}
+
+		started[i] = true
+		wg.Add(1)
+		go func(i int, q testsuite.Question) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			defer close(ready[i])
 
+			result, err := r.strategy.Execute(ctx, client, model.Name, q, systemPrompt, model.Temperature)
+
+			r.progressMu.Lock()
+			completed += waiting[i]
 			if r.progress != nil {
-				r.progress(model.Name, i+1, len(questions))
+				r.progress(model.Name, completed, len(questions))
 			}
+			r.progressMu.Unlock()
 
-			result, err := r.strategy.Execute(ctx, client, model.Name, q, systemPrompt, model.Temperature)
 			if err != nil {
 				slog.Error("question execution failed",
 					"question_id", q.ID,
 					"error", err,
 				)
-				// Continue with next question on error.
-				continue
+				return
 			}
-			results = append(results, result)
-		}
+			if err := checkpoint.Write(result); err != nil {
+				slog.Error("failed to checkpoint answer", "question_id", q.ID, "error", err)
+			}
+			results[i] = result
+		}(i, q)
+	}
 
-		// Write results file.
-		output := r.strategy.FormatResults(results)
-		safeModelName := sanitizeFilename(model.Name)
-		resultsFile := filepath.Join(outputPath, fmt.Sprintf("%s.txt", safeModelName))
-		if err := os.WriteFile(resultsFile, []byte(output), 0o644); err != nil {
-			return nil, fmt.Errorf("failed to write results for model %s: %w", model.Name, err)
+	// Release the writer from questions that were never sent.
+	for i := range questions {
+		if leader[i] == i && !started[i] {
+			close(ready[i])
 		}
+	}
 
-		modelRun := testsuite.ModelRun{
-			ModelName:   model.Name,
-			Duration:    time.Since(modelStart),
-			ResultsFile: resultsFile,
-			Results:     results,
-		}
-		run.Models = append(run.Models, modelRun)
+	wg.Wait()
+	err := <-writeErr
 
-		slog.Info("model evaluation complete",
-			"model", model.Name,
-			"questions_answered", len(results),
-			"duration", modelRun.Duration,
-		)
+	// Drop failed and undispatched questions, preserving order.
+	return slices.DeleteFunc(results, func(res *testsuite.Result) bool { return res == nil }), err
+}
 
-		// Call afterModel hook (e.g. teardown KServe InferenceService).
-		if r.afterModel != nil {
-			if err := r.afterModel(ctx, model); err != nil {
-				slog.Error("after-model hook failed", "model", model.Name, "error", err)
-				// Continue with next model; don't fail the entire run.
-			}
+// writeInOrder writes results to w in question order, waiting for each
+// question's leader to finish before writing it. Duplicates of leaders that
+// were sent get a copy of their leader's answer here; they were already
+// counted for progress when the leader finished. After a write error it keeps
+// consuming results, so that they are still returned to the caller.
+func (r *Runner) writeInOrder(w io.Writer, questions []testsuite.Question, results []*testsuite.Result, leader []int, ready []chan struct{}, checkpoint *checkpointWriter) error {
+	var werr error
+	for i, q := range questions {
+		l := leader[i]
+		<-ready[l]
+
+		if l != i && results[i] == nil && results[l] != nil {
+			results[i] = duplicateResult(q, results[l], checkpoint)
+		}
+
+		if results[i] != nil && werr == nil {
+			werr = r.strategy.WriteResult(w, results[i])
 		}
 	}
+	return werr
+}
 
-	run.Duration = time.Since(timestamp)
+// duplicateResult returns leaderResult's answer as the result for q, a question
+// with the same text, and checkpoints it.
+func duplicateResult(q testsuite.Question, leaderResult *testsuite.Result, checkpoint *checkpointWriter) *testsuite.Result {
+	res := &testsuite.Result{
+		Question: q,
+		Answer:   leaderResult.Answer,
+		Duration: leaderResult.Duration,
+	}
+	if err := checkpoint.Write(res); err != nil {
+		slog.Error("failed to checkpoint answer", "question_id", q.ID, "error", err)
+	}
+	return res
+}
 
-	// Write metadata.
-	if err := writeRunMetadata(outputPath, run); err != nil {
-		return nil, fmt.Errorf("failed to write run metadata: %w", err)
+// writeResultsFile creates path and calls write with a buffered writer for it,
+// flushing and closing the file afterwards.
+func writeResultsFile(path string, write func(w io.Writer) error) (err error) {
+	f, err := os.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0o644)
+	if err != nil {
+		return err
 	}
+	defer func() {
+		if cerr := f.Close(); err == nil {
+			err = cerr
+		}
+	}()
 
-	return run, nil
+	w := bufio.NewWriter(f)
+	if err := write(w); err != nil {
+		return err
+	}
+	return w.Flush()
 }
 
 // sanitizeFilename replaces characters unsafe for filenames with underscores.
@@ -209,24 +577,39 @@ func sanitizeFilename(name string) string {
 	return replacer.Replace(name)
 }
 
+// runMetadata is the resultset.json manifest of a test run. Fields are
+// declared in key order, so the encoding matches a sorted JSON object.
+type runMetadata struct {
+	FullDuration float64         `json:"full_duration"` // seconds
+	ID           string          `json:"id"`
+	Models       []modelMetadata `json:"models"`
+	Suite        string          `json:"suite"`
+	Timestamp    time.Time       `json:"timestamp"`
+}
+
+// modelMetadata describes one model's results within runMetadata.
+type modelMetadata struct {
+	Duration    float64 `json:"duration"` // seconds
+	ModelName   string  `json:"model_name"`
+	ResultsFile string  `json:"results_file"`
+}
+
 func writeRunMetadata(outputPath string, run *testsuite.TestRun) error {
-	models := make([]map[string]interface{}, 0, len(run.Models))
+	metadata := runMetadata{
+		FullDuration: run.Duration.Seconds(),
+		ID:           run.ID,
+		Models:       make([]modelMetadata, 0, len(run.Models)),
+		Suite:        run.Suite,
+		Timestamp:    run.Timestamp,
+	}
 	for _, m := range run.Models {
-		models = append(models, map[string]interface{}{
-			"model_name":   m.ModelName,
-			"duration":     m.Duration.Seconds(),
-			"results_file": m.ResultsFile,
+		metadata.Models = append(metadata.Models, modelMetadata{
+			Duration:    m.Duration.Seconds(),
+			ModelName:   m.ModelName,
+			ResultsFile: m.ResultsFile,
 		})
 	}
 
-	metadata := map[string]interface{}{
-		"id":            run.ID,
-		"suite":         run.Suite,
-		"timestamp":     run.Timestamp,
-		"full_duration": run.Duration.Seconds(),
-		"models":        models,
-	}
-
 	data, err := json.MarshalIndent(metadata, "", "    ")
 	if err != nil {
 		return err
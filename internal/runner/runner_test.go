@@ -2,6 +2,8 @@ package runner
 
 import (
 	"context"
+	"encoding/json"
+	"fmt"
 	"os"
 	"path/filepath"
 	"testing"
@@ -10,6 +12,7 @@ import (
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 
+	"github.com/giantswarm/llm-testing/internal/llm"
 	"github.com/giantswarm/llm-testing/internal/testsuite"
 	"github.com/giantswarm/llm-testing/internal/testutil"
 )
@@ -56,6 +59,37 @@ func TestRunnerExecutesSuite(t *testing.T) {
 	assert.FileExists(t, metadataFile)
 }
 
+func TestWriteRunMetadata(t *testing.T) {
+	tmpDir := t.TempDir()
+	run := &testsuite.TestRun{
+		ID:        "suite_20260101-120000",
+		Suite:     "suite",
+		Timestamp: time.Date(2026, 1, 1, 12, 0, 0, 0, time.UTC),
+		Duration:  90 * time.Second,
+		Models: []testsuite.ModelRun{
+			{ModelName: "m", Duration: 1500 * time.Millisecond, ResultsFile: "m.txt"},
+		},
+	}
+
+	require.NoError(t, writeRunMetadata(tmpDir, run))
+
+	data, err := os.ReadFile(filepath.Join(tmpDir, "resultset.json"))
+	require.NoError(t, err)
+	assert.Equal(t, `{
+    "full_duration": 90,
+    "id": "suite_20260101-120000",
+    "models": [
+        {
+            "duration": 1.5,
+            "model_name": "m",
+            "results_file": "m.txt"
+        }
+    ],
+    "suite": "suite",
+    "timestamp": "2026-01-01T12:00:00Z"
+}`, string(data))
+}
+
 func TestRunnerMultipleModels(t *testing.T) {
 	tmpDir := t.TempDir()
 
@@ -222,3 +256,458 @@ func TestRunnerAfterModelHook(t *testing.T) {
 	require.NoError(t, err)
 	assert.Equal(t, []string{"model-a", "model-b"}, teardownCalls)
 }
+
+func TestRunnerConcurrentQuestions(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	client := &testutil.SlowLLMClient{Delay: 20 * time.Millisecond}
+	strategy, _ := GetStrategy("qa")
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetConcurrency(4)
+
+	var questions []testsuite.Question
+	for i := 1; i <= 12; i++ {
+		questions = append(questions, testsuite.Question{
+			ID:           fmt.Sprintf("%d", i),
+			Section:      "S",
+			QuestionText: fmt.Sprintf("Q%d", i),
+		})
+	}
+
+	suite := &testsuite.TestSuite{
+		Name:      "concurrent",
+		Strategy:  "qa",
+		Prompt:    testsuite.Prompt{SystemMessage: "test"},
+		Questions: questions,
+	}
+
+	run, err := r.Run(context.Background(), suite, []testsuite.Model{{Name: "m"}})
+	require.NoError(t, err)
+
+	// Results keep question order regardless of completion order.
+	results := run.Models[0].Results
+	require.Len(t, results, 12)
+	for i, res := range results {
+		assert.Equal(t, questions[i].ID, res.Question.ID)
+		assert.Equal(t, "answer: "+questions[i].QuestionText, res.Answer)
+	}
+
+	assert.LessOrEqual(t, client.Peak(), 4)
+	assert.Greater(t, client.Peak(), 1)
+}
+
+func TestRunnerSetConcurrencyMinimum(t *testing.T) {
+	strategy, _ := GetStrategy("qa")
+	r := NewRunner(&testutil.MockLLMClient{}, strategy, t.TempDir())
+
+	assert.Equal(t, DefaultConcurrency, r.concurrency)
+
+	r.SetConcurrency(0)
+	assert.Equal(t, 1, r.concurrency)
+}
+
+func TestRunnerParallelModels(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	client := &testutil.SlowLLMClient{Delay: 20 * time.Millisecond}
+	strategy, _ := GetStrategy("qa")
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetConcurrency(1)
+	r.SetParallelModels(true)
+
+	progress := make(map[string]int)
+	r.SetProgressFunc(func(model string, idx, total int) {
+		progress[model] = idx
+	})
+
+	suite := &testsuite.TestSuite{
+		Name:     "parallel-models",
+		Strategy: "qa",
+		Prompt:   testsuite.Prompt{SystemMessage: "test"},
+		Questions: []testsuite.Question{
+			{ID: "1", Section: "S", QuestionText: "Q1"},
+			{ID: "2", Section: "S", QuestionText: "Q2"},
+		},
+	}
+
+	models := []testsuite.Model{{Name: "model-a"}, {Name: "model-b"}, {Name: "model-c"}}
+
+	run, err := r.Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	// Models are reported in input order even though they ran concurrently.
+	require.Len(t, run.Models, 3)
+	for i, m := range models {
+		assert.Equal(t, m.Name, run.Models[i].ModelName)
+		assert.Len(t, run.Models[i].Results, 2)
+		assert.FileExists(t, run.Models[i].ResultsFile)
+		assert.Equal(t, 2, progress[m.Name])
+	}
+
+	// With one question in flight per model, overlap can only come from models.
+	assert.Greater(t, client.Peak(), 1)
+}
+
+func TestRunnerRequestsPerMinute(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	client := &testutil.MockLLMClient{}
+	strategy, _ := GetStrategy("qa")
+	r := NewRunner(client, strategy, tmpDir)
+	// 1200 rpm = one request every 50ms after the first.
+	r.SetRequestsPerMinute(1200)
+
+	suite := &testsuite.TestSuite{
+		Name:     "rate-limited",
+		Strategy: "qa",
+		Prompt:   testsuite.Prompt{SystemMessage: "test"},
+		Questions: []testsuite.Question{
+			{ID: "1", Section: "S", QuestionText: "Q1"},
+			{ID: "2", Section: "S", QuestionText: "Q2"},
+			{ID: "3", Section: "S", QuestionText: "Q3"},
+		},
+	}
+
+	start := time.Now()
+	run, err := r.Run(context.Background(), suite, []testsuite.Model{{Name: "m"}})
+	require.NoError(t, err)
+
+	assert.Len(t, run.Models[0].Results, 3)
+	assert.GreaterOrEqual(t, time.Since(start), 100*time.Millisecond)
+
+	r.SetRequestsPerMinute(0)
+	assert.Nil(t, r.limiter)
+}
+
+// checkpointLine encodes e as one line of a checkpoint file.
+func checkpointLine(t *testing.T, e checkpointEntry) string {
+	t.Helper()
+	data, err := json.Marshal(e)
+	require.NoError(t, err)
+	return string(data) + "\n"
+}
+
+func TestRunnerResume(t *testing.T) {
+	tmpDir := t.TempDir()
+	strategy, _ := GetStrategy("qa")
+
+	suite := &testsuite.TestSuite{
+		Name:     "resume",
+		Strategy: "qa",
+		Prompt:   testsuite.Prompt{SystemMessage: "test"},
+		Questions: []testsuite.Question{
+			{ID: "1", Section: "S", QuestionText: "Q1", ExpectedAnswer: "A1"},
+			{ID: "2", Section: "S", QuestionText: "Q2", ExpectedAnswer: "A2"},
+		},
+	}
+	models := []testsuite.Model{{Name: "m", Temperature: 0}}
+
+	first, err := NewRunner(&testutil.MockLLMClient{DefaultResponse: "first"}, strategy, tmpDir).Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	// Simulate an interruption after question 1: keep only its checkpoint
+	// line, followed by a partially written one.
+	checkpointFile := filepath.Join(tmpDir, first.ID, "m.jsonl")
+	require.FileExists(t, checkpointFile)
+	line := checkpointLine(t, checkpointEntry{QuestionID: "1", Question: "Q1", PromptHash: promptHash("test"), Answer: "first", Duration: 0.1})
+	require.NoError(t, os.WriteFile(checkpointFile, []byte(line+`{"qid":"2","ans`), 0o644))
+
+	client := &testutil.MockLLMClient{DefaultResponse: "second"}
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetResumeRunID(first.ID)
+
+	run, err := r.Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	assert.Equal(t, first.ID, run.ID)
+	assert.Equal(t, 1, client.Calls)
+	require.Len(t, run.Models[0].Results, 2)
+	assert.Equal(t, "first", run.Models[0].Results[0].Answer)
+	assert.Equal(t, "second", run.Models[0].Results[1].Answer)
+
+	done, err := loadCheckpoint(checkpointFile)
+	require.NoError(t, err)
+	assert.Len(t, done, 2)
+}
+
+func TestRunnerResumeIgnoresChangedQuestions(t *testing.T) {
+	tmpDir := t.TempDir()
+	strategy, _ := GetStrategy("qa")
+	models := []testsuite.Model{{Name: "m"}}
+
+	suite := &testsuite.TestSuite{
+		Name:      "resume",
+		Strategy:  "qa",
+		Questions: []testsuite.Question{{ID: "1", Section: "S", QuestionText: "What is a Pod?", ExpectedAnswer: "A"}},
+	}
+	first, err := NewRunner(&testutil.MockLLMClient{DefaultResponse: "old"}, strategy, tmpDir).Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	// Question 1 was rewritten in the CSV since the interrupted run.
+	suite.Questions[0].QuestionText = "What is a Deployment?"
+
+	client := &testutil.MockLLMClient{DefaultResponse: "new"}
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetResumeRunID(first.ID)
+
+	run, err := r.Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	assert.Equal(t, 1, client.Calls)
+	require.Len(t, run.Models[0].Results, 1)
+	assert.Equal(t, "new", run.Models[0].Results[0].Answer)
+
+	// A different temperature or system prompt invalidates the answer too.
+	suite.Prompt.SystemMessage = "changed"
+	_, err = r.Run(context.Background(), suite, models)
+	require.NoError(t, err)
+	assert.Equal(t, 2, client.Calls)
+
+	_, err = r.Run(context.Background(), suite, []testsuite.Model{{Name: "m", Temperature: 0.7}})
+	require.NoError(t, err)
+	assert.Equal(t, 3, client.Calls)
+}
+
+func TestRunnerSameModelAtTwoTemperatures(t *testing.T) {
+	tmpDir := t.TempDir()
+	client := &testutil.MockLLMClient{DefaultResponse: "answer"}
+	strategy, _ := GetStrategy("qa")
+
+	suite := &testsuite.TestSuite{
+		Name:      "temps",
+		Strategy:  "qa",
+		Questions: []testsuite.Question{{ID: "1", Section: "S", QuestionText: "Q", ExpectedAnswer: "A"}},
+	}
+	models := []testsuite.Model{{Name: "m", Temperature: 0}, {Name: "m", Temperature: 0.7}}
+
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetParallelModels(true)
+	run, err := r.Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	// Both entries are queried and get their own files.
+	assert.Equal(t, 2, client.Calls)
+	require.Len(t, run.Models, 2)
+	assert.Equal(t, "m_temp0.txt", filepath.Base(run.Models[0].ResultsFile))
+	assert.Equal(t, "m_temp0.7.txt", filepath.Base(run.Models[1].ResultsFile))
+
+	// The same model and temperature twice cannot be told apart.
+	_, err = r.Run(context.Background(), suite, []testsuite.Model{{Name: "m"}, {Name: "m"}})
+	assert.Error(t, err)
+}
+
+func TestRunnerResumeUnknownRun(t *testing.T) {
+	strategy, _ := GetStrategy("qa")
+	r := NewRunner(&testutil.MockLLMClient{}, strategy, t.TempDir())
+
+	suite := &testsuite.TestSuite{
+		Name:      "resume",
+		Strategy:  "qa",
+		Questions: []testsuite.Question{{ID: "1", Section: "S", QuestionText: "Q", ExpectedAnswer: "A"}},
+	}
+	models := []testsuite.Model{{Name: "m"}}
+
+	r.SetResumeRunID("does-not-exist")
+	_, err := r.Run(context.Background(), suite, models)
+	assert.Error(t, err)
+
+	r.SetResumeRunID("../escape")
+	_, err = r.Run(context.Background(), suite, models)
+	assert.Error(t, err)
+}
+
+func TestRunnerAsksDuplicateQuestionsOnce(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	client := &testutil.MockLLMClient{
+		Responses: map[string]string{
+			"What is a Pod?":     "smallest deployable unit",
+			"What is a Service?": "stable network endpoint",
+		},
+	}
+	strategy, _ := GetStrategy("qa")
+
+	var lastProgress, progressTotal int
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetProgressFunc(func(_ string, idx, total int) {
+		lastProgress, progressTotal = idx, total
+	})
+
+	suite := &testsuite.TestSuite{
+		Name:     "dedupe",
+		Strategy: "qa",
+		Prompt:   testsuite.Prompt{SystemMessage: "test"},
+		Questions: []testsuite.Question{
+			{ID: "1", Section: "Workloads", QuestionText: "What is a Pod?", ExpectedAnswer: "A"},
+			{ID: "2", Section: "Networking", QuestionText: "What is a Service?", ExpectedAnswer: "B"},
+			{ID: "3", Section: "Review", QuestionText: "What is a Pod?", ExpectedAnswer: "A"},
+		},
+	}
+
+	run, err := r.Run(context.Background(), suite, []testsuite.Model{{Name: "m"}})
+	require.NoError(t, err)
+
+	assert.Equal(t, 2, client.Calls)
+	assert.Equal(t, 3, lastProgress)
+	assert.Equal(t, 3, progressTotal)
+
+	results := run.Models[0].Results
+	require.Len(t, results, 3)
+	assert.Equal(t, "3", results[2].Question.ID)
+	assert.Equal(t, "Review", results[2].Question.Section)
+	assert.Equal(t, "smallest deployable unit", results[2].Answer)
+}
+
+// delayedClient answers each question after the delay configured for it, so
+// answers complete in a different order than the questions were sent.
+type delayedClient struct {
+	testutil.MockLLMClient
+	delays map[string]time.Duration
+}
+
+func (c *delayedClient) ChatCompletion(ctx context.Context, req llm.ChatRequest) (*llm.ChatResponse, error) {
+	select {
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	case <-time.After(c.delays[req.UserMessage]):
+	}
+	return &llm.ChatResponse{Content: "answer to " + req.UserMessage}, nil
+}
+
+func TestRunnerResumeReportsDuplicatesOfCheckpointedQuestions(t *testing.T) {
+	tmpDir := t.TempDir()
+	strategy, _ := GetStrategy("qa")
+	models := []testsuite.Model{{Name: "m"}}
+
+	suite := &testsuite.TestSuite{
+		Name:     "resume",
+		Strategy: "qa",
+		Questions: []testsuite.Question{
+			{ID: "1", Section: "S", QuestionText: "What is a Pod?", ExpectedAnswer: "A"},
+			{ID: "2", Section: "S", QuestionText: "What is a Pod?", ExpectedAnswer: "A"},
+		},
+	}
+	first, err := NewRunner(&testutil.MockLLMClient{DefaultResponse: "pod"}, strategy, tmpDir).Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	// Interrupted before the duplicate was filled in: only the leader is checkpointed.
+	checkpointFile := filepath.Join(tmpDir, first.ID, "m.jsonl")
+	line := checkpointLine(t, checkpointEntry{QuestionID: "1", Question: "What is a Pod?", PromptHash: promptHash(""), Answer: "pod", Duration: 0.1})
+	require.NoError(t, os.WriteFile(checkpointFile, []byte(line), 0o644))
+
+	client := &testutil.MockLLMClient{}
+	r := NewRunner(client, strategy, tmpDir)
+	r.SetResumeRunID(first.ID)
+	var lastProgress, progressTotal int
+	r.SetProgressFunc(func(_ string, idx, total int) {
+		lastProgress, progressTotal = idx, total
+	})
+
+	run, err := r.Run(context.Background(), suite, models)
+	require.NoError(t, err)
+
+	assert.Equal(t, 0, client.Calls)
+	assert.Equal(t, 2, lastProgress)
+	assert.Equal(t, 2, progressTotal)
+	require.Len(t, run.Models[0].Results, 2)
+	assert.Equal(t, "pod", run.Models[0].Results[1].Answer)
+}
+
+func TestRunnerWritesResultsInQuestionOrder(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	client := &delayedClient{delays: map[string]time.Duration{
+		"Q1": 60 * time.Millisecond,
+		"Q2": 30 * time.Millisecond,
+		"Q3": 0,
+	}}
+	strategy, _ := GetStrategy("qa")
+	r := NewRunner(client, strategy, tmpDir)
+
+	suite := &testsuite.TestSuite{
+		Name:     "order",
+		Strategy: "qa",
+		Prompt:   testsuite.Prompt{SystemMessage: "test"},
+		Questions: []testsuite.Question{
+			{ID: "1", Section: "S", QuestionText: "Q1", ExpectedAnswer: "A1"},
+			{ID: "2", Section: "S", QuestionText: "Q2", ExpectedAnswer: "A2"},
+			{ID: "3", Section: "S", QuestionText: "Q3", ExpectedAnswer: "A3"},
+		},
+	}
+
+	run, err := r.Run(context.Background(), suite, []testsuite.Model{{Name: "m"}})
+	require.NoError(t, err)
+
+	results := run.Models[0].Results
+	require.Len(t, results, 3)
+	for i, res := range results {
+		assert.Equal(t, fmt.Sprint(i+1), res.Question.ID)
+	}
+
+	data, err := os.ReadFile(run.Models[0].ResultsFile)
+	require.NoError(t, err)
+	assert.Equal(t, formatResults(t, strategy, results), string(data))
+}
+
+func TestRunnerModelHooksAroundCheckpoint(t *testing.T) {
+	strategy, _ := GetStrategy("qa")
+	suite := &testsuite.TestSuite{
+		Name:      "hooks",
+		Strategy:  "qa",
+		Questions: []testsuite.Question{{ID: "1", Section: "S", QuestionText: "Q", ExpectedAnswer: "A"}},
+	}
+	models := []testsuite.Model{{Name: "m"}}
+
+	// newRunner returns a runner resuming run "run" in a fresh output
+	// directory, prepared by setup, and records the lifecycle hook calls.
+	newRunner := func(t *testing.T, setup func(runDir string)) (*Runner, *[]string) {
+		tmpDir := t.TempDir()
+		runDir := filepath.Join(tmpDir, "run")
+		require.NoError(t, os.MkdirAll(runDir, 0o755))
+		setup(runDir)
+
+		var calls []string
+		r := NewRunner(&testutil.MockLLMClient{}, strategy, tmpDir)
+		r.SetResumeRunID("run")
+		r.SetClientForModelFunc(func(_ context.Context, _ testsuite.Model) (llm.Client, error) {
+			calls = append(calls, "deploy")
+			return &testutil.MockLLMClient{}, nil
+		})
+		r.SetAfterModelFunc(func(_ context.Context, _ testsuite.Model) error {
+			calls = append(calls, "teardown")
+			return nil
+		})
+		return r, &calls
+	}
+
+	t.Run("corrupt checkpoint fails before deploying", func(t *testing.T) {
+		r, calls := newRunner(t, func(runDir string) {
+			require.NoError(t, os.WriteFile(filepath.Join(runDir, "m.jsonl"), []byte("not json\n"), 0o644))
+		})
+		_, err := r.Run(context.Background(), suite, models)
+		assert.Error(t, err)
+		assert.Empty(t, *calls)
+	})
+
+	t.Run("results write failure still tears down", func(t *testing.T) {
+		r, calls := newRunner(t, func(runDir string) {
+			// A directory in place of the results file makes it unwritable.
+			require.NoError(t, os.MkdirAll(filepath.Join(runDir, "m.txt"), 0o755))
+		})
+		_, err := r.Run(context.Background(), suite, models)
+		assert.Error(t, err)
+		assert.Equal(t, []string{"deploy", "teardown"}, *calls)
+	})
+
+	t.Run("nothing left to ask skips deployment", func(t *testing.T) {
+		r, calls := newRunner(t, func(runDir string) {
+			line := checkpointLine(t, checkpointEntry{QuestionID: "1", Question: "Q", PromptHash: promptHash(""), Answer: "done"})
+			require.NoError(t, os.WriteFile(filepath.Join(runDir, "m.jsonl"), []byte(line), 0o644))
+		})
+		run, err := r.Run(context.Background(), suite, models)
+		require.NoError(t, err)
+		assert.Empty(t, *calls)
+		require.Len(t, run.Models[0].Results, 1)
+		assert.Equal(t, "done", run.Models[0].Results[0].Answer)
+	})
+}
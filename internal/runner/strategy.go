@@ -2,6 +2,7 @@ package runner
 
 import (
 	"context"
+	"io"
 
 	"github.com/giantswarm/llm-testing/internal/llm"
 	"github.com/giantswarm/llm-testing/internal/testsuite"
@@ -19,8 +20,8 @@ type EvaluationStrategy interface {
 	// Execute runs a single question against the LLM and returns the result.
 	Execute(ctx context.Context, client llm.Client, model string, question testsuite.Question, systemPrompt string, temperature float64) (*testsuite.Result, error)
 
-	// FormatResults converts results into the output text format.
-	FormatResults(results []*testsuite.Result) string
+	// WriteResult writes a single result to w in the output text format.
+	WriteResult(w io.Writer, result *testsuite.Result) error
 }
 
 // GetStrategy returns an EvaluationStrategy for the given strategy name.
@@ -8,9 +8,9 @@ import (
 	"math"
 	"os"
 	"regexp"
-	"slices"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/giantswarm/llm-testing/internal/llm"
@@ -19,10 +19,37 @@ import (
 // DefaultScoringModel is the default model used for LLM-as-judge scoring.
 const DefaultScoringModel = "claude-sonnet-4-5-20250514"
 
+// DefaultMaxChunkChars is the default size above which results are scored in chunks.
+const DefaultMaxChunkChars = 50000
+
+// DefaultConcurrency is the default number of scoring requests in flight.
+const DefaultConcurrency = 8
+
 // Config holds scoring configuration.
 type Config struct {
 	Model       string
 	Repetitions int
+
+	// Stream requests streaming completions for evaluation. Only the final
+	// text is used, so this is off by default; enable it for endpoints or
+	// proxies that time out on long-running non-streaming requests.
+	Stream bool
+
+	// Batch submits all repetitions as one asynchronous batch job (OpenAI
+	// Batch API) instead of individual requests. Batches are cheaper for
+	// hosted providers but can take a long time to complete, so this is
+	// meant for offline scoring. The client must implement llm.BatchClient.
+	Batch bool
+
+	// MaxChunkChars is the largest results content sent to the judge in one
+	// request. Larger content is split at question boundaries into chunks
+	// that are scored separately and summed, keeping the prompt within the
+	// judge's context window. Defaults to DefaultMaxChunkChars.
+	MaxChunkChars int
+
+	// Concurrency is the maximum number of scoring requests (repetitions
+	// times chunks) in flight at once. Defaults to DefaultConcurrency.
+	Concurrency int
 }
 
 // RunScore represents the parsed result of a single scoring run.
@@ -73,6 +100,12 @@ func NewScorer(client llm.Client, config Config) *Scorer {
 	if config.Model == "" {
 		config.Model = DefaultScoringModel
 	}
+	if config.MaxChunkChars <= 0 {
+		config.MaxChunkChars = DefaultMaxChunkChars
+	}
+	if config.Concurrency <= 0 {
+		config.Concurrency = DefaultConcurrency
+	}
 	return &Scorer{client: client, config: config}
 }
 
@@ -86,7 +119,9 @@ func (s *Scorer) ScoreFile(ctx context.Context, resultsFile string) (*ScoreOutpu
 	return s.Score(ctx, string(content), resultsFile)
 }
 
-// Score evaluates the given results content.
+// Score evaluates the given results content. All repetitions (and the chunks
+// of large content) are scored concurrently, with at most config.Concurrency
+// requests in flight; runs are reported in repetition order.
 func (s *Scorer) Score(ctx context.Context, content string, resultsFile string) (*ScoreOutput, error) {
 	output := &ScoreOutput{
 		Metadata: ScoreMetadata{
@@ -95,43 +130,117 @@ func (s *Scorer) Score(ctx context.Context, content string, resultsFile string)
 			ScoringModel: s.config.Model,
 			Repetitions:  s.config.Repetitions,
 		},
-		Runs: make([]RunScore, 0, s.config.Repetitions),
+		Runs: make([]RunScore, s.config.Repetitions),
 	}
 
-	for i := 0; i < s.config.Repetitions; i++ {
-		slog.Info("scoring run",
-			"run", i+1,
-			"total", s.config.Repetitions,
-		)
-
-		resultText, err := s.evaluate(ctx, content)
-		if err != nil {
-			slog.Error("scoring run failed", "run", i+1, "error", err)
-			output.Runs = append(output.Runs, RunScore{
-				RawOutput: "",
-				ParseErr:  err.Error(),
-			})
-			continue
-		}
+	chunks := splitIntoChunks(content, s.config.MaxChunkChars)
+	if len(chunks) > 1 {
+		slog.Info("scoring results in chunks", "chunks", len(chunks), "chars", len(content))
+	}
 
-		parsed := parseScore(resultText)
-		output.Runs = append(output.Runs, parsed)
+	// texts[i][j] and errs[i][j] hold the judge output for chunk j of repetition i.
+	texts := make([][]string, s.config.Repetitions)
+	errs := make([][]error, s.config.Repetitions)
+	for i := range texts {
+		texts[i] = make([]string, len(chunks))
+		errs[i] = make([]error, len(chunks))
+	}
 
-		if parsed.Correct != nil {
-			slog.Info("score parsed",
+	if s.config.Batch {
+		if err := s.scoreBatch(ctx, chunks, texts, errs); err != nil {
+			return nil, err
+		}
+	} else {
+		// Repetitions are independent samples and chunks are independent
+		// parts of the input, so requests can run concurrently.
+		sem := make(chan struct{}, s.config.Concurrency)
+		var wg sync.WaitGroup
+		for i := 0; i < s.config.Repetitions; i++ {
+			slog.Info("scoring run",
 				"run", i+1,
-				"correct", *parsed.Correct,
-				"total", *parsed.Total,
-				"percentage", *parsed.Percent,
+				"total", s.config.Repetitions,
 			)
+			for j, chunk := range chunks {
+				sem <- struct{}{}
+				wg.Add(1)
+				go func(i, j int, chunk string) {
+					defer wg.Done()
+					defer func() { <-sem }()
+					texts[i][j], errs[i][j] = s.evaluate(ctx, chunk)
+				}(i, j, chunk)
+			}
 		}
+		wg.Wait()
 	}
 
+	for i := range output.Runs {
+		output.Runs[i] = s.parseRun(i+1, texts[i], errs[i])
+	}
 	output.Summary = calculateStatistics(output.Runs)
 
 	return output, nil
 }
 
+// scoreBatch submits every chunk of every repetition as a single batch job
+// and fills texts and errs with the results.
+func (s *Scorer) scoreBatch(ctx context.Context, chunks []string, texts [][]string, errs [][]error) error {
+	bc, ok := s.client.(llm.BatchClient)
+	if !ok {
+		return fmt.Errorf("scoring client does not support batch requests")
+	}
+
+	reqs := make([]llm.ChatRequest, 0, len(texts)*len(chunks))
+	for range texts {
+		for _, chunk := range chunks {
+			reqs = append(reqs, s.evaluationRequest(chunk))
+		}
+	}
+
+	slog.Info("submitting scoring batch", "repetitions", len(texts), "requests", len(reqs))
+	results, err := bc.ChatCompletionBatch(ctx, reqs)
+	if err != nil {
+		return fmt.Errorf("batch scoring failed: %w", err)
+	}
+
+	for n, res := range results {
+		i, j := n/len(chunks), n%len(chunks)
+		if res.Response != nil {
+			texts[i][j] = res.Response.Content
+		}
+		errs[i][j] = res.Err
+	}
+	return nil
+}
+
+// parseRun converts the judge outputs for the chunks of one scoring
+// repetition into a RunScore.
+func (s *Scorer) parseRun(run int, texts []string, errs []error) RunScore {
+	for j, err := range errs {
+		if err == nil {
+			continue
+		}
+		if len(errs) > 1 {
+			err = fmt.Errorf("chunk %d of %d: %w", j+1, len(errs), err)
+		}
+		slog.Error("scoring run failed", "run", run, "error", err)
+		return RunScore{
+			RawOutput: "",
+			ParseErr:  err.Error(),
+		}
+	}
+
+	parsed := parseChunkScores(texts)
+	if parsed.Correct != nil {
+		slog.Info("score parsed",
+			"run", run,
+			"correct", *parsed.Correct,
+			"total", *parsed.Total,
+			"percentage", *parsed.Percent,
+		)
+	}
+	return parsed
+}
+
 // WriteScoreFile writes the score output as JSON next to the results file.
 func WriteScoreFile(output *ScoreOutput, resultsFile string) (string, error) {
 	scoresFile := strings.TrimSuffix(resultsFile, ".txt") + "_scores.json"
@@ -148,31 +257,33 @@ func WriteScoreFile(output *ScoreOutput, resultsFile string) (string, error) {
 	return scoresFile, nil
 }
 
-func (s *Scorer) evaluate(ctx context.Context, content string) (string, error) {
-	// Try streaming first.
-	stream, err := s.client.ChatCompletionStream(ctx, llm.ChatRequest{
+// evaluationRequest builds the LLM-as-judge request for the given results content.
+func (s *Scorer) evaluationRequest(content string) llm.ChatRequest {
+	return llm.ChatRequest{
 		Model:         s.config.Model,
 		SystemMessage: EvaluationPrompt,
 		UserMessage:   content,
 		Temperature:   llm.Float64Ptr(0),
-	})
-	if err == nil {
-		result, streamErr := llm.CollectStream(stream)
-		if streamErr == nil {
-			return result, nil
+	}
+}
+
+func (s *Scorer) evaluate(ctx context.Context, content string) (string, error) {
+	req := s.evaluationRequest(content)
+
+	if s.config.Stream {
+		stream, err := s.client.ChatCompletionStream(ctx, req)
+		if err == nil {
+			result, streamErr := llm.CollectStream(stream)
+			if streamErr == nil {
+				return result, nil
+			}
+			slog.Warn("streaming evaluation failed, falling back to non-streaming", "error", streamErr)
+		} else {
+			slog.Debug("streaming not available, using non-streaming", "error", err)
 		}
-		slog.Warn("streaming evaluation failed, falling back to non-streaming", "error", streamErr)
-	} else {
-		slog.Debug("streaming not available, using non-streaming", "error", err)
 	}
 
-	// Fallback to non-streaming.
-	resp, err := s.client.ChatCompletion(ctx, llm.ChatRequest{
-		Model:         s.config.Model,
-		SystemMessage: EvaluationPrompt,
-		UserMessage:   content,
-		Temperature:   llm.Float64Ptr(0),
-	})
+	resp, err := s.client.ChatCompletion(ctx, req)
 	if err != nil {
 		return "", fmt.Errorf("evaluation failed: %w", err)
 	}
@@ -180,6 +291,67 @@ func (s *Scorer) evaluate(ctx context.Context, content string) (string, error) {
 	return resp.Content, nil
 }
 
+// blockStart marks the start of every question block after the first in a
+// results file, as written by the QA strategy. The "NO. " header is part of
+// the marker because "---" lines also occur inside answers, e.g. between
+// YAML documents or as markdown rules.
+const blockStart = "\n---\nNO. "
+
+// splitIntoChunks splits results content into chunks of at most maxChars,
+// cutting only between question blocks. A single block larger than maxChars
+// becomes a chunk of its own. Content within the limit is returned unchanged.
+func splitIntoChunks(content string, maxChars int) []string {
+	if len(content) <= maxChars {
+		return []string{content}
+	}
+
+	// Block end offsets; each block starts where the previous one ends.
+	var ends []int
+	for off := 0; ; {
+		i := strings.Index(content[off:], blockStart)
+		if i < 0 {
+			break
+		}
+		off += i + 1 // the block starts after the newline
+		ends = append(ends, off)
+	}
+	ends = append(ends, len(content))
+
+	var chunks []string
+	chunkStart, blockBegin := 0, 0
+	for _, end := range ends {
+		if blockBegin > chunkStart && end-chunkStart > maxChars {
+			chunks = append(chunks, content[chunkStart:blockBegin])
+			chunkStart = blockBegin
+		}
+		blockBegin = end
+	}
+	return append(chunks, content[chunkStart:])
+}
+
+// parseChunkScores parses the judge output for each chunk and sums the
+// scores. The combined result fails to parse if any chunk does.
+func parseChunkScores(texts []string) RunScore {
+	if len(texts) == 1 {
+		return parseScore(texts[0])
+	}
+
+	raw := strings.Join(texts, "\n\n")
+	var correct, total int
+	for j, text := range texts {
+		parsed := parseScore(text)
+		if parsed.Correct == nil {
+			return RunScore{
+				RawOutput: raw,
+				ParseErr:  fmt.Sprintf("chunk %d of %d: %s", j+1, len(texts), parsed.ParseErr),
+			}
+		}
+		correct += *parsed.Correct
+		total += *parsed.Total
+	}
+	return newRunScore(correct, total, raw)
+}
+
 var scorePattern = regexp.MustCompile(`(\d+)\s+out\s+of\s+(\d+)`)
 
 func parseScore(text string) RunScore {
@@ -193,6 +365,11 @@ func parseScore(text string) RunScore {
 
 	correct, _ := strconv.Atoi(matches[1])
 	total, _ := strconv.Atoi(matches[2])
+	return newRunScore(correct, total, text)
+}
+
+// newRunScore builds a parsed RunScore, deriving the percentage.
+func newRunScore(correct, total int, rawOutput string) RunScore {
 	pct := 0.0
 	if total > 0 {
 		pct = math.Round(float64(correct)/float64(total)*10000) / 100
@@ -202,30 +379,50 @@ func parseScore(text string) RunScore {
 		Correct:   &correct,
 		Total:     &total,
 		Percent:   &pct,
-		RawOutput: text,
+		RawOutput: rawOutput,
 	}
 }
 
+// calculateStatistics aggregates the parsed runs in a single pass. Variance is
+// the population variance, computed from the running sum of squares.
 func calculateStatistics(runs []RunScore) Summary {
-	var correctValues []int
-	var percentValues []float64
+	var (
+		n          int
+		sumCorrect int
+		sumSquares int
+		sumPercent float64
+		minC, maxC int
+	)
 
 	for _, r := range runs {
-		if r.Correct != nil {
-			correctValues = append(correctValues, *r.Correct)
-			percentValues = append(percentValues, *r.Percent)
+		if r.Correct == nil {
+			continue
+		}
+		c := *r.Correct
+		if n == 0 || c < minC {
+			minC = c
+		}
+		if n == 0 || c > maxC {
+			maxC = c
 		}
+		n++
+		sumCorrect += c
+		sumSquares += c * c
+		sumPercent += *r.Percent
 	}
 
-	if len(correctValues) == 0 {
+	if n == 0 {
 		return Summary{AllRunsParsed: false}
 	}
 
-	meanCorrect := meanInt(correctValues)
-	meanPercent := meanFloat(percentValues)
-	minC := slices.Min(correctValues)
-	maxC := slices.Max(correctValues)
-	variance := varianceFloat(correctValues, meanCorrect)
+	mean := float64(sumCorrect) / float64(n)
+	// Integer sums keep this exact up to the final subtraction; clamp the
+	// float rounding error that could otherwise produce a tiny negative value.
+	variance := max(float64(sumSquares)/float64(n)-mean*mean, 0)
+
+	meanCorrect := round2(mean)
+	meanPercent := round2(sumPercent / float64(n))
+	variance = round2(variance)
 
 	return Summary{
 		MeanCorrect:   &meanCorrect,
@@ -233,35 +430,11 @@ func calculateStatistics(runs []RunScore) Summary {
 		MinCorrect:    &minC,
 		MaxCorrect:    &maxC,
 		Variance:      &variance,
-		AllRunsParsed: len(correctValues) == len(runs),
+		AllRunsParsed: n == len(runs),
 	}
 }
 
-func meanInt(vals []int) float64 {
-	sum := 0
-	for _, v := range vals {
-		sum += v
-	}
-	return math.Round(float64(sum)/float64(len(vals))*100) / 100
-}
-
-func meanFloat(vals []float64) float64 {
-	sum := 0.0
-	for _, v := range vals {
-		sum += v
-	}
-	return math.Round(sum/float64(len(vals))*100) / 100
-}
-
-// varianceFloat calculates the population variance of integer values given a precomputed mean.
-func varianceFloat(vals []int, mean float64) float64 {
-	if len(vals) == 0 {
-		return 0
-	}
-	sumSquaredDiff := 0.0
-	for _, v := range vals {
-		diff := float64(v) - mean
-		sumSquaredDiff += diff * diff
-	}
-	return math.Round(sumSquaredDiff/float64(len(vals))*100) / 100
+// round2 rounds v to two decimal places.
+func round2(v float64) float64 {
+	return math.Round(v*100) / 100
 }
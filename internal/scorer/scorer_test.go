@@ -3,15 +3,31 @@ package scorer
 import (
 	"context"
 	"encoding/json"
+	"fmt"
 	"os"
+	"strings"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 
+	"github.com/giantswarm/llm-testing/internal/llm"
 	"github.com/giantswarm/llm-testing/internal/testutil"
 )
 
+// streamCountingClient wraps MockLLMClient and counts streaming attempts.
+type streamCountingClient struct {
+	*testutil.MockLLMClient
+	streamCalls atomic.Int32
+}
+
+func (c *streamCountingClient) ChatCompletionStream(ctx context.Context, req llm.ChatRequest) (*llm.StreamReader, error) {
+	c.streamCalls.Add(1)
+	return c.MockLLMClient.ChatCompletionStream(ctx, req)
+}
+
 func TestParseScore(t *testing.T) {
 	tests := []struct {
 		name    string
@@ -169,6 +185,113 @@ func TestScorerScore(t *testing.T) {
 	assert.InDelta(t, 0.0, *output.Summary.Variance, 0.01)
 }
 
+func TestScorerRunsRepetitionsConcurrently(t *testing.T) {
+	client := &testutil.SlowLLMClient{
+		Delay:    20 * time.Millisecond,
+		Response: "64 out of 100 answers are correct.",
+	}
+
+	s := NewScorer(client, Config{Model: "scorer", Repetitions: 5})
+	output, err := s.Score(context.Background(), "content", "file.txt")
+	require.NoError(t, err)
+
+	require.Len(t, output.Runs, 5)
+	for _, run := range output.Runs {
+		require.NotNil(t, run.Correct)
+		assert.Equal(t, 64, *run.Correct)
+	}
+	assert.Equal(t, 5, client.Peak())
+}
+
+func TestScorerConcurrencyLimit(t *testing.T) {
+	client := &testutil.SlowLLMClient{
+		Delay:    20 * time.Millisecond,
+		Response: "1 out of 1 answers are correct.",
+	}
+
+	content := "---\nNO. 1\nACTUAL ANSWER: a\n---\nNO. 2\nACTUAL ANSWER: b\n"
+	s := NewScorer(client, Config{Repetitions: 3, MaxChunkChars: 30, Concurrency: 2})
+	output, err := s.Score(context.Background(), content, "file.txt")
+	require.NoError(t, err)
+
+	// 3 repetitions x 2 chunks, at most 2 at a time.
+	require.Len(t, output.Runs, 3)
+	assert.LessOrEqual(t, client.Peak(), 2)
+	for _, run := range output.Runs {
+		require.NotNil(t, run.Total)
+		assert.Equal(t, 2, *run.Total)
+	}
+}
+
+func TestScorerStreamingIsOptIn(t *testing.T) {
+	client := &streamCountingClient{
+		MockLLMClient: &testutil.MockLLMClient{DefaultResponse: "10 out of 10"},
+	}
+
+	// Default: non-streaming only.
+	_, err := NewScorer(client, Config{Repetitions: 2}).Score(context.Background(), "content", "file.txt")
+	require.NoError(t, err)
+	assert.Equal(t, int32(0), client.streamCalls.Load())
+	assert.Equal(t, 2, client.Calls)
+
+	// Stream enabled: streaming is attempted, then falls back on failure.
+	output, err := NewScorer(client, Config{Repetitions: 2, Stream: true}).Score(context.Background(), "content", "file.txt")
+	require.NoError(t, err)
+	assert.Equal(t, int32(2), client.streamCalls.Load())
+	for _, run := range output.Runs {
+		require.NotNil(t, run.Correct)
+		assert.Equal(t, 10, *run.Correct)
+	}
+}
+
+// batchMockClient is a MockLLMClient that also implements llm.BatchClient.
+type batchMockClient struct {
+	*testutil.MockLLMClient
+	batchRequests []llm.ChatRequest
+	results       []llm.BatchResult
+}
+
+func (c *batchMockClient) ChatCompletionBatch(_ context.Context, reqs []llm.ChatRequest) ([]llm.BatchResult, error) {
+	c.batchRequests = reqs
+	return c.results, nil
+}
+
+func TestScorerBatchMode(t *testing.T) {
+	client := &batchMockClient{
+		MockLLMClient: &testutil.MockLLMClient{},
+		results: []llm.BatchResult{
+			{Response: &llm.ChatResponse{Content: "70 out of 100 answers are correct."}},
+			{Err: fmt.Errorf("request expired")},
+			{Response: &llm.ChatResponse{Content: "72 out of 100 answers are correct."}},
+		},
+	}
+
+	s := NewScorer(client, Config{Model: "scorer", Repetitions: 3, Batch: true})
+	output, err := s.Score(context.Background(), "content", "file.txt")
+	require.NoError(t, err)
+
+	// One batch with one request per repetition; no individual calls.
+	require.Len(t, client.batchRequests, 3)
+	assert.Equal(t, "content", client.batchRequests[0].UserMessage)
+	assert.Equal(t, "scorer", client.batchRequests[0].Model)
+	assert.Equal(t, 0, client.Calls)
+
+	require.Len(t, output.Runs, 3)
+	require.NotNil(t, output.Runs[0].Correct)
+	assert.Equal(t, 70, *output.Runs[0].Correct)
+	assert.Contains(t, output.Runs[1].ParseErr, "request expired")
+	require.NotNil(t, output.Runs[2].Correct)
+	assert.Equal(t, 72, *output.Runs[2].Correct)
+	assert.False(t, output.Summary.AllRunsParsed)
+}
+
+func TestScorerBatchModeUnsupportedClient(t *testing.T) {
+	s := NewScorer(&testutil.MockLLMClient{}, Config{Repetitions: 2, Batch: true})
+	_, err := s.Score(context.Background(), "content", "file.txt")
+	assert.Error(t, err)
+	assert.Contains(t, err.Error(), "does not support batch")
+}
+
 func TestScorerDefaultRepetitions(t *testing.T) {
 	s := NewScorer(&testutil.MockLLMClient{DefaultResponse: "50 out of 100"}, Config{})
 	assert.Equal(t, 3, s.config.Repetitions)
@@ -280,3 +403,83 @@ func TestScorerHandlesParseFailure(t *testing.T) {
 	assert.Nil(t, output.Summary.MeanCorrect)
 	assert.False(t, output.Summary.AllRunsParsed)
 }
+
+func TestSplitIntoChunks(t *testing.T) {
+	block := func(n int) string {
+		return fmt.Sprintf("---\nNO. %d - S\nQUESTION: Q%d\nEXPECTED ANSWER: A\nACTUAL ANSWER: A\n", n, n)
+	}
+	content := block(1) + block(2) + block(3)
+
+	// Within the limit: unchanged.
+	assert.Equal(t, []string{content}, splitIntoChunks(content, len(content)))
+
+	// Two blocks fit per chunk.
+	chunks := splitIntoChunks(content, 2*len(block(1)))
+	assert.Equal(t, []string{block(1) + block(2), block(3)}, chunks)
+
+	// Blocks larger than the limit are never split.
+	chunks = splitIntoChunks(content, 10)
+	assert.Equal(t, []string{block(1), block(2), block(3)}, chunks)
+}
+
+func TestSplitIntoChunksKeepsSeparatorsInAnswers(t *testing.T) {
+	// The first answer is a multi-document YAML manifest with a markdown rule.
+	yamlBlock := "---\nNO. 1 - Workloads\nQUESTION: Show a Deployment and a Service\nEXPECTED ANSWER: A\n" +
+		"ACTUAL ANSWER: apiVersion: apps/v1\nkind: Deployment\n---\napiVersion: v1\nkind: Service\n---\nDone.\n"
+	plainBlock := "---\nNO. 2 - Networking\nQUESTION: Q2\nEXPECTED ANSWER: B\nACTUAL ANSWER: B\n"
+	content := yamlBlock + plainBlock
+
+	// The limit falls just past the first "---" inside the YAML answer, which
+	// a cut at every separator would have chosen as a chunk boundary.
+	limit := strings.Index(yamlBlock, "kind: Service")
+	chunks := splitIntoChunks(content, limit)
+
+	assert.Equal(t, []string{yamlBlock, plainBlock}, chunks)
+	for _, chunk := range chunks {
+		assert.True(t, strings.HasPrefix(chunk, "---\nNO. "), "chunk must start with a question header: %q", chunk)
+	}
+}
+
+func TestScorerScoresLargeContentInChunks(t *testing.T) {
+	content := "---\nNO. 1\nACTUAL ANSWER: a\n---\nNO. 2\nACTUAL ANSWER: b\n"
+	chunks := splitIntoChunks(content, 30)
+	require.Len(t, chunks, 2)
+
+	client := &testutil.MockLLMClient{
+		Responses: map[string]string{
+			chunks[0]: "1 out of 1 answers are correct.",
+			chunks[1]: "0 out of 1 answers are correct.",
+		},
+	}
+
+	s := NewScorer(client, Config{Repetitions: 2, MaxChunkChars: 30})
+	output, err := s.Score(context.Background(), content, "file.txt")
+	require.NoError(t, err)
+
+	assert.Equal(t, 4, client.Calls)
+	for _, run := range output.Runs {
+		require.NotNil(t, run.Correct)
+		assert.Equal(t, 1, *run.Correct)
+		assert.Equal(t, 2, *run.Total)
+		assert.Equal(t, 50.0, *run.Percent)
+	}
+}
+
+func TestScorerChunkParseFailure(t *testing.T) {
+	content := "---\nNO. 1\nACTUAL ANSWER: a\n---\nNO. 2\nACTUAL ANSWER: b\n"
+	chunks := splitIntoChunks(content, 30)
+
+	client := &testutil.MockLLMClient{
+		Responses: map[string]string{
+			chunks[0]: "1 out of 1 answers are correct.",
+			chunks[1]: "no score here",
+		},
+	}
+
+	output, err := NewScorer(client, Config{Repetitions: 1, MaxChunkChars: 30}).Score(context.Background(), content, "file.txt")
+	require.NoError(t, err)
+
+	assert.Nil(t, output.Runs[0].Correct)
+	assert.Contains(t, output.Runs[0].ParseErr, "chunk 2 of 2")
+	assert.False(t, output.Summary.AllRunsParsed)
+}
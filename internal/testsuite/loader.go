@@ -11,6 +11,8 @@ import (
 	"path"
 	"path/filepath"
 	"strings"
+	"sync"
+	"time"
 
 	"gopkg.in/yaml.v3"
 )
@@ -18,6 +20,22 @@ import (
 //go:embed all:testdata
 var embeddedSuites embed.FS
 
+// configCacheEntry is a parsed config.yaml together with the file signature
+// it was parsed from.
+type configCacheEntry struct {
+	modTime time.Time
+	size    int64
+	suite   TestSuite
+}
+
+// configCache holds parsed suite configs keyed by suite location, so that
+// repeated loads (e.g. list_test_suites in a long-running server) skip the
+// YAML parse while the file is unchanged.
+var (
+	configCacheMu sync.Mutex
+	configCache   = make(map[string]configCacheEntry)
+)
+
 // Load loads a test suite by name, searching first in the external directory
 // (if provided), then in the embedded test suites.
 func Load(name string, externalDir string) (*TestSuite, error) {
@@ -25,7 +43,7 @@ func Load(name string, externalDir string) (*TestSuite, error) {
 	if externalDir != "" {
 		path := filepath.Join(externalDir, name)
 		if info, err := os.Stat(path); err == nil && info.IsDir() {
-			return loadFromFS(os.DirFS(path), name)
+			return loadFromFS(os.DirFS(path), name, path)
 		}
 	}
 
@@ -35,7 +53,7 @@ func Load(name string, externalDir string) (*TestSuite, error) {
 	if err != nil {
 		return nil, fmt.Errorf("test suite %q not found: %w", name, err)
 	}
-	return loadFromFS(subFS, name)
+	return loadFromFS(subFS, name, "embedded:"+name)
 }
 
 // List returns the names of all available test suites.
@@ -69,16 +87,10 @@ func List(externalDir string) ([]string, error) {
 	return names, nil
 }
 
-func loadFromFS(fsys fs.FS, name string) (*TestSuite, error) {
-	// Load config.yaml.
-	configData, err := fs.ReadFile(fsys, "config.yaml")
+func loadFromFS(fsys fs.FS, name, cacheKey string) (*TestSuite, error) {
+	suite, err := loadConfig(fsys, name, cacheKey)
 	if err != nil {
-		return nil, fmt.Errorf("failed to read config.yaml for suite %q: %w", name, err)
-	}
-
-	var suite TestSuite
-	if err := yaml.Unmarshal(configData, &suite); err != nil {
-		return nil, fmt.Errorf("failed to parse config.yaml for suite %q: %w", name, err)
+		return nil, err
 	}
 
 	if suite.Strategy == "" {
@@ -98,6 +110,42 @@ func loadFromFS(fsys fs.FS, name string) (*TestSuite, error) {
 	return &suite, nil
 }
 
+// loadConfig parses config.yaml from fsys. The parsed config is cached under
+// cacheKey and reused as long as the file's modification time and size match.
+func loadConfig(fsys fs.FS, name, cacheKey string) (TestSuite, error) {
+	info, err := fs.Stat(fsys, "config.yaml")
+	if err != nil {
+		return TestSuite{}, fmt.Errorf("failed to read config.yaml for suite %q: %w", name, err)
+	}
+
+	configCacheMu.Lock()
+	entry, ok := configCache[cacheKey]
+	configCacheMu.Unlock()
+	if ok && entry.modTime.Equal(info.ModTime()) && entry.size == info.Size() {
+		return entry.suite, nil
+	}
+
+	configData, err := fs.ReadFile(fsys, "config.yaml")
+	if err != nil {
+		return TestSuite{}, fmt.Errorf("failed to read config.yaml for suite %q: %w", name, err)
+	}
+
+	var suite TestSuite
+	if err := yaml.Unmarshal(configData, &suite); err != nil {
+		return TestSuite{}, fmt.Errorf("failed to parse config.yaml for suite %q: %w", name, err)
+	}
+
+	configCacheMu.Lock()
+	configCache[cacheKey] = configCacheEntry{
+		modTime: info.ModTime(),
+		size:    info.Size(),
+		suite:   suite,
+	}
+	configCacheMu.Unlock()
+
+	return suite, nil
+}
+
 func loadQuestionsFromFS(fsys fs.FS, filename string) ([]Question, error) {
 	f, err := fsys.Open(filename)
 	if err != nil {
@@ -108,6 +156,7 @@ func loadQuestionsFromFS(fsys fs.FS, filename string) ([]Question, error) {
 	reader := csv.NewReader(f)
 	reader.LazyQuotes = true
 	reader.FieldsPerRecord = -1 // Allow variable field counts.
+	reader.ReuseRecord = true   // Fields are copied into Question; the slice itself is not kept.
 
 	// Read header.
 	header, err := reader.Read()
@@ -127,6 +176,10 @@ func loadQuestionsFromFS(fsys fs.FS, filename string) ([]Question, error) {
 		}
 	}
 
+	// Resolve column positions once instead of looking them up per row.
+	idxID, idxSection := colIndex["ID"], colIndex["Section"]
+	idxQuestion, idxExpected := colIndex["Question"], colIndex["ExpectedAnswer"]
+
 	// Determine the minimum number of columns required by checking the max column index.
 	minCols := 0
 	for _, idx := range colIndex {
@@ -149,10 +202,10 @@ func loadQuestionsFromFS(fsys fs.FS, filename string) ([]Question, error) {
 		}
 
 		questions = append(questions, Question{
-			ID:             record[colIndex["ID"]],
-			Section:        record[colIndex["Section"]],
-			QuestionText:   record[colIndex["Question"]],
-			ExpectedAnswer: record[colIndex["ExpectedAnswer"]],
+			ID:             record[idxID],
+			Section:        record[idxSection],
+			QuestionText:   record[idxQuestion],
+			ExpectedAnswer: record[idxExpected],
 		})
 	}
 
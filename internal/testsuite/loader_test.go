@@ -142,3 +142,35 @@ prompt:
 	assert.Equal(t, "99", suite.Version)
 	assert.Len(t, suite.Questions, 1)
 }
+
+func TestLoadReparsesChangedConfig(t *testing.T) {
+	tmpDir := t.TempDir()
+	suiteDir := filepath.Join(tmpDir, "cached-suite")
+	require.NoError(t, os.MkdirAll(suiteDir, 0o755))
+
+	csv := `ID,Section,Question,ExpectedAnswer
+1,Basics,What is Go?,A programming language
+`
+	require.NoError(t, os.WriteFile(filepath.Join(suiteDir, "questions.csv"), []byte(csv), 0o644))
+
+	configPath := filepath.Join(suiteDir, "config.yaml")
+	require.NoError(t, os.WriteFile(configPath, []byte("name: First\nversion: \"1\"\n"), 0o644))
+
+	suite, err := Load("cached-suite", tmpDir)
+	require.NoError(t, err)
+	assert.Equal(t, "First", suite.Name)
+	assert.Contains(t, configCache, suiteDir)
+
+	// Unchanged file is served from the cache.
+	suite, err = Load("cached-suite", tmpDir)
+	require.NoError(t, err)
+	assert.Equal(t, "First", suite.Name)
+
+	// Rewriting the file changes its signature and forces a re-parse.
+	require.NoError(t, os.WriteFile(configPath, []byte("name: Second suite\nversion: \"2\"\n"), 0o644))
+
+	suite, err = Load("cached-suite", tmpDir)
+	require.NoError(t, err)
+	assert.Equal(t, "Second suite", suite.Name)
+	assert.Equal(t, "2", suite.Version)
+}
@@ -4,12 +4,16 @@ package testutil
 import (
 	"context"
 	"fmt"
+	"sync"
 
 	"github.com/giantswarm/llm-testing/internal/llm"
 )
 
 // MockLLMClient is a configurable mock for llm.Client used across test packages.
+// It is safe for concurrent use.
 type MockLLMClient struct {
+	mu sync.Mutex
+
 	// Responses maps user messages to canned responses.
 	Responses map[string]string
 
@@ -24,6 +28,9 @@ type MockLLMClient struct {
 }
 
 func (m *MockLLMClient) ChatCompletion(_ context.Context, req llm.ChatRequest) (*llm.ChatResponse, error) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+
 	m.Calls++
 	m.LastRequest = req
 
@@ -0,0 +1,55 @@
+package testutil
+
+import (
+	"context"
+	"fmt"
+	"sync/atomic"
+	"time"
+
+	"github.com/giantswarm/llm-testing/internal/llm"
+)
+
+// SlowLLMClient is an llm.Client that answers after a fixed delay and records
+// the peak number of concurrent calls. Useful for asserting concurrency bounds.
+type SlowLLMClient struct {
+	// Delay is how long each ChatCompletion call blocks before answering.
+	Delay time.Duration
+
+	// Response is returned for every call. When empty, the user message is
+	// echoed back as "answer: <message>".
+	Response string
+
+	inFlight atomic.Int32
+	peak     atomic.Int32
+}
+
+func (c *SlowLLMClient) ChatCompletion(ctx context.Context, req llm.ChatRequest) (*llm.ChatResponse, error) {
+	n := c.inFlight.Add(1)
+	defer c.inFlight.Add(-1)
+	for {
+		p := c.peak.Load()
+		if n <= p || c.peak.CompareAndSwap(p, n) {
+			break
+		}
+	}
+
+	select {
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	case <-time.After(c.Delay):
+	}
+
+	if c.Response != "" {
+		return &llm.ChatResponse{Content: c.Response}, nil
+	}
+	return &llm.ChatResponse{Content: "answer: " + req.UserMessage}, nil
+}
+
+func (c *SlowLLMClient) ChatCompletionStream(_ context.Context, _ llm.ChatRequest) (*llm.StreamReader, error) {
+	return nil, fmt.Errorf("streaming not supported in mock")
+}
+
+// Peak returns the highest number of ChatCompletion calls observed in flight at once.
+func (c *SlowLLMClient) Peak() int {
+	return int(c.peak.Load())
+}